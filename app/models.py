@@ -154,18 +154,24 @@ class Holding(Base):
         Index('idx_holding_snapshot', 'portfolio_snapshot_id'),
         Index('idx_holding_symbol', 'symbol'),
         Index('idx_holding_asset_type', 'asset_type'),
+        Index('idx_holding_snapshot_asset_type', 'portfolio_snapshot_id', 'asset_type'),
     )
     
-    @property
-    def underlying_holdings_list(self):
-        """Parse underlying holdings JSON to list"""
-        if self.underlying_holdings:
+    @staticmethod
+    def parse_underlying_holdings(underlying_holdings):
+        """Parse underlying holdings JSON text to list (for column-only queries)"""
+        if underlying_holdings:
             try:
-                return json.loads(self.underlying_holdings)
+                return json.loads(underlying_holdings)
             except json.JSONDecodeError:
                 return []
         return []
     
+    @property
+    def underlying_holdings_list(self):
+        """Parse underlying holdings JSON to list"""
+        return Holding.parse_underlying_holdings(self.underlying_holdings)
+    
     @underlying_holdings_list.setter
     def underlying_holdings_list(self, value):
         """Set underlying holdings from list"""
@@ -22,6 +22,7 @@ def get_portfolio_projections():
     
     Query params:
         lookback_years: Years of historical data to use (3, 5, or 10). Default 5.
+        method: 'analytic' or 'monte_carlo' (simulated return paths). Default analytic.
     
     Returns:
         JSON with projections and risk metrics
@@ -33,6 +34,10 @@ def get_portfolio_projections():
         if lookback_years not in [3, 5, 10]:
             lookback_years = 5
         
+        method = request.args.get('method', 'analytic')
+        if method not in ['analytic', 'monte_carlo']:
+            method = 'analytic'
+        
         # Get current holdings
         aggregator = HoldingsAggregator()
         holdings_data = aggregator.get_aggregated_holdings()
@@ -52,7 +57,8 @@ def get_portfolio_projections():
                     },
                     'projections': [],
                     'assumptions': {
-                        'lookback_years': lookback_years
+                        'lookback_years': lookback_years,
+                        'method': method
                     }
                 },
                 'message': 'No holdings found'
@@ -60,7 +66,7 @@ def get_portfolio_projections():
         
         # Get projections with specified lookback period
         service = PortfolioProjectionService()
-        projection_data = service.get_projection_summary(holdings, total_value, lookback_years)
+        projection_data = service.get_projection_summary(holdings, total_value, lookback_years, method)
         
         return jsonify({
             'success': True,
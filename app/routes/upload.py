@@ -12,6 +12,7 @@ from app.database import db_session
 from app.models import BrokerAccount, PortfolioSnapshot, Holding
 from app.services.merrill_csv_parser import MerrillCSVParser
 from app.services.fidelity_csv_parser import FidelityCSVParser
+from app.services.risk_aggregator import invalidate_risk_metrics_cache
 from datetime import datetime
 from decimal import Decimal
 import os
@@ -328,6 +329,7 @@ def store_portfolio_data(broker_name: str, parsed_data: dict, csv_filename: str)
         
         # Commit to database
         session.commit()
+        invalidate_risk_metrics_cache()
         
         # Return snapshot ID
         return snapshot.id
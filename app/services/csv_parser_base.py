@@ -6,7 +6,7 @@ Each broker has different CSV formats, so we need custom parsers.
 """
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from decimal import Decimal
 import logging
 
@@ -250,8 +250,31 @@ class CSVParserBase(ABC):
         Returns:
             str: Actual column name if found, None otherwise
         """
+        return self.match_column(df.columns, possible_names)
+    
+    @staticmethod
+    def match_column(columns: Sequence[str], possible_names: Sequence[str]) -> Optional[str]:
+        """
+        Find column by trying multiple possible names (case-insensitive)
+        
+        Same as find_column but works on bare column names, so results can
+        be cached per header layout without holding on to a DataFrame.
+        
+        Args:
+            columns: Column names
+            possible_names: Possible column names to try, in priority order
+            
+        Returns:
+            str: Actual column name if found, None otherwise
+        """
+        # Lower-cased name -> first column with that name, so each alias is a
+        # dict lookup instead of a scan over every column
+        by_lower = {}
+        for actual in columns:
+            by_lower.setdefault(actual.lower(), actual)
+        
         for possible in possible_names:
-            for actual in df.columns:
-                if possible.lower() == actual.lower():
-                    return actual
+            actual = by_lower.get(possible.lower())
+            if actual is not None:
+                return actual
         return None
\ No newline at end of file
@@ -28,7 +28,7 @@ IMPORTANT LESSONS (from Fidelity/Merrill parser bugs):
 """
 from app.services.csv_parser_base import CSVParserBase
 import pandas as pd
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from decimal import Decimal
 import logging
 import re
@@ -45,6 +45,8 @@ class ETradeCSVParser(CSVParserBase):
     def __init__(self):
         super().__init__()
         self.broker_name = 'etrade'
+        # (symbol, description) -> asset type, so repeated lots resolve once
+        self._asset_type_cache: Dict[Tuple[str, str], str] = {}
     
     def validate_csv(self, file_path: str) -> tuple[bool, Optional[str]]:
         """
@@ -539,7 +541,16 @@ class ETradeCSVParser(CSVParserBase):
             return Decimal('0.00')
     
     def _detect_asset_type_safe(self, symbol: str, description: str) -> str:
-        """Safely detect asset type using the resolver"""
+        """Safely detect asset type using the resolver (memoized per parser)"""
+        key = (symbol, description)
+        asset_type = self._asset_type_cache.get(key)
+        if asset_type is None:
+            asset_type = self._resolve_asset_type(symbol, description)
+            self._asset_type_cache[key] = asset_type
+        return asset_type
+    
+    def _resolve_asset_type(self, symbol: str, description: str) -> str:
+        """Resolve asset type, falling back to 'stock' on any resolver failure"""
         try:
             from app.services.asset_type_resolver import resolve_asset_type
             return resolve_asset_type(
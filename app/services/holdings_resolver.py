@@ -67,22 +67,23 @@ class HoldingsResolver:
                             })
                     
                     if matches:
-                        logger.info(f"  Found {len(matches)} matches for {symbol} as {type_name}")
-                        for match in matches:
-                            logger.info(f"    - {match['name']} ({match['exchange']})")
+                        logger.info("  Found %d matches for %s as %s", len(matches), symbol, type_name)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            for match in matches:
+                                logger.debug("    - %s (%s)", match['name'], match['exchange'])
                         
                         # CRITICAL: Pick FIRST US exchange match ONLY
                         for match in matches:
                             if match['exchange'] in us_exchanges:
-                                logger.info(f"  ✓ Selected US exchange: {match['exchange']}")
+                                logger.info("  ✓ Selected US exchange: %s", match['exchange'])
                                 return match
                         
-                        logger.info(f"  No US exchange found for {symbol}, trying first available")
+                        logger.info("  No US exchange found for %s, trying first available", symbol)
                         # If no US exchange, return first match anyway (for international ETFs listed elsewhere)
                         return matches[0]
             
             except Exception as e:
-                logger.warning(f"Error searching {type_name} for {symbol}: {e}")
+                logger.warning("Error searching %s for %s: %s", type_name, symbol, e)
                 continue
         
         return None
@@ -102,18 +103,18 @@ class HoldingsResolver:
             - 'verified_asset_type': The asset type confirmed by mstarpy (may differ from input)
         """
         if asset_type not in ['etf', 'mutual_fund']:
-            logger.debug(f"Skipping {symbol} - not an ETF or mutual fund")
+            logger.debug("Skipping %s - not an ETF or mutual fund", symbol)
             return None
         
-        logger.info(f"Resolving underlying holdings for {symbol} ({asset_type})...")
+        logger.info("Resolving underlying holdings for %s (%s)...", symbol, asset_type)
         
         try:
             # STEP 1: Search for the fund to get security ID
-            logger.info(f"  Searching for US fund: {symbol}")
+            logger.info("  Searching for US fund: %s", symbol)
             fund_info = self._search_us_fund(symbol)
             
             if not fund_info:
-                logger.warning(f"No fund found for {symbol}")
+                logger.warning("No fund found for %s", symbol)
                 return None
             
             sec_id = fund_info["securityID"]
@@ -123,9 +124,9 @@ class HoldingsResolver:
             
             # Check if mstarpy returned a different asset type
             if verified_asset_type != asset_type:
-                logger.info(f"  Asset type update: {symbol} was {asset_type}, mstarpy says {verified_asset_type}")
+                logger.info("  Asset type update: %s was %s, mstarpy says %s", symbol, asset_type, verified_asset_type)
             
-            logger.info(f"  Found: {fund_name} ({exchange}) - SecID: {sec_id}")
+            logger.info("  Found: %s (%s) - SecID: %s", fund_name, exchange, sec_id)
             
             # STEP 2: Get holdings using security ID
             fund = ms.Funds(sec_id)
@@ -136,23 +137,37 @@ class HoldingsResolver:
                 holdings_df = fund.holdings()
             
             if holdings_df is None or holdings_df.empty:
-                logger.warning(f"No holdings data found for {symbol}")
+                logger.warning("No holdings data found for %s", symbol)
                 return {
                     'holdings': None,
                     'verified_asset_type': verified_asset_type
                 }
             
-            logger.info(f"Found {len(holdings_df)} holdings for {symbol}")
+            logger.info("Found %d holdings for %s", len(holdings_df), symbol)
+            
+            # Validate the schema once up front instead of guarding every row
+            columns = set(holdings_df.columns)
+            has_ticker = 'ticker' in columns
+            has_sec_id = 'secId' in columns
+            if 'weighting' not in columns or not (has_ticker or has_sec_id):
+                logger.warning("Holdings data for %s missing required columns: %s", symbol, sorted(columns))
+                return {
+                    'holdings': None,
+                    'verified_asset_type': verified_asset_type
+                }
+            has_name = 'securityName' in columns
+            has_shares = 'numberOfShare' in columns
+            has_market_value = 'marketValue' in columns
             
             # STEP 3: Log sample tickers for debugging (no warning, just info)
             sample_tickers = []
             for idx, row in holdings_df.head(10).iterrows():
-                if 'ticker' in row and pd.notna(row['ticker']):
+                if has_ticker and pd.notna(row['ticker']):
                     ticker = str(row['ticker']).strip().upper()
                     sample_tickers.append(ticker)
             
             if sample_tickers:
-                logger.info(f"  Sample holdings: {sample_tickers[:5]}")
+                logger.info("  Sample holdings: %s", sample_tickers[:5])
                 # Note: International tickers are fine, we handle them in stock_info_service
             
             # STEP 4: Process holdings DataFrame
@@ -162,74 +177,71 @@ class HoldingsResolver:
             # mstarpy returns percentages (sum ~= 100)
             # If sum > 10, it's percentage format; if sum < 2, it's decimal format
             all_weights = [float(row['weighting']) for _, row in holdings_df.iterrows() 
-                          if pd.notna(row.get('weighting')) and float(row['weighting']) > 0]
+                          if pd.notna(row['weighting']) and float(row['weighting']) > 0]
             weight_sum = sum(all_weights)
             
             # Determine format: if sum > 10, it's percentage (should sum to ~100)
             # If sum < 2, it's decimal (should sum to ~1.0)
             is_percentage_format = weight_sum > 10
-            logger.info(f"  Weight sum: {weight_sum:.2f} - format: {'percentage' if is_percentage_format else 'decimal'}")
+            logger.info("  Weight sum: %.2f - format: %s", weight_sum, 'percentage' if is_percentage_format else 'decimal')
             
+            n_skip = 0
             for idx, row in holdings_df.iterrows():
-                try:
-                    ticker = None
-                    if 'ticker' in row and pd.notna(row['ticker']) and str(row['ticker']).strip():
-                        ticker = str(row['ticker']).strip().upper()
-                    elif 'secId' in row and pd.notna(row['secId']) and str(row['secId']).strip():
-                        ticker = str(row['secId']).strip().upper()
-                    
-                    name = str(row['securityName']).strip() if pd.notna(row.get('securityName')) else ''
-                    raw_weight = float(row['weighting']) if pd.notna(row.get('weighting')) else 0.0
-                    
-                    # Get shares directly from mstarpy if available
-                    mstar_shares = float(row['numberOfShare']) if pd.notna(row.get('numberOfShare')) else None
-                    mstar_market_value = float(row['marketValue']) if pd.notna(row.get('marketValue')) else None
-                    
-                    if not ticker or raw_weight == 0:
-                        continue
-                    
-                    # Convert to decimal based on detected format
-                    if is_percentage_format:
-                        # Percentage format (13.23 = 13.23%) -> divide by 100
-                        weight_decimal = raw_weight / 100.0
-                    else:
-                        # Already decimal format (0.1323 = 13.23%)
-                        weight_decimal = raw_weight
-                    
-                    estimated_value = float(total_value) * weight_decimal
-                    
-                    # Calculate shares: use mstarpy data to derive price, then calculate our shares
-                    estimated_shares = None
-                    if mstar_shares and mstar_market_value and mstar_shares > 0:
-                        # mstar_market_value is the fund's total holding value
-                        # mstar_shares is the fund's total shares
-                        # stock_price = mstar_market_value / mstar_shares
-                        stock_price = mstar_market_value / mstar_shares
-                        if stock_price > 0:
-                            # Our shares = our_value / stock_price
-                            estimated_shares = round(estimated_value / stock_price, 4)
-                    
-                    underlying.append({
-                        'symbol': ticker,
-                        'name': name or ticker,
-                        'weight': round(weight_decimal, 6),
-                        'value': round(estimated_value, 2),
-                        'shares': estimated_shares
-                    })
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing holding row in {symbol}: {e}")
+                ticker = None
+                if has_ticker and pd.notna(row['ticker']) and str(row['ticker']).strip():
+                    ticker = str(row['ticker']).strip().upper()
+                elif has_sec_id and pd.notna(row['secId']) and str(row['secId']).strip():
+                    ticker = str(row['secId']).strip().upper()
+                
+                name = str(row['securityName']).strip() if has_name and pd.notna(row['securityName']) else ''
+                raw_weight = float(row['weighting']) if pd.notna(row['weighting']) else 0.0
+                
+                # Get shares directly from mstarpy if available
+                mstar_shares = float(row['numberOfShare']) if has_shares and pd.notna(row['numberOfShare']) else None
+                mstar_market_value = float(row['marketValue']) if has_market_value and pd.notna(row['marketValue']) else None
+                
+                if not ticker or raw_weight == 0:
+                    n_skip += 1
                     continue
+                
+                # Convert to decimal based on detected format
+                if is_percentage_format:
+                    # Percentage format (13.23 = 13.23%) -> divide by 100
+                    weight_decimal = raw_weight / 100.0
+                else:
+                    # Already decimal format (0.1323 = 13.23%)
+                    weight_decimal = raw_weight
+                
+                estimated_value = float(total_value) * weight_decimal
+                
+                # Calculate shares: use mstarpy data to derive price, then calculate our shares
+                estimated_shares = None
+                if mstar_shares and mstar_market_value and mstar_shares > 0:
+                    # mstar_market_value is the fund's total holding value
+                    # mstar_shares is the fund's total shares
+                    # stock_price = mstar_market_value / mstar_shares
+                    stock_price = mstar_market_value / mstar_shares
+                    if stock_price > 0:
+                        # Our shares = our_value / stock_price
+                        estimated_shares = round(estimated_value / stock_price, 4)
+                
+                underlying.append({
+                    'symbol': ticker,
+                    'name': name or ticker,
+                    'weight': round(weight_decimal, 6),
+                    'value': round(estimated_value, 2),
+                    'shares': estimated_shares
+                })
             
             if len(underlying) == 0:
-                logger.warning(f"No valid holdings extracted for {symbol}")
+                logger.warning("No valid holdings extracted for %s", symbol)
                 return {
                     'holdings': None,
                     'verified_asset_type': verified_asset_type
                 }
             
             underlying.sort(key=lambda x: x['weight'], reverse=True)
-            logger.info(f"Successfully resolved {len(underlying)} holdings for {symbol}")
+            logger.info("Successfully resolved %d holdings for %s (%d skipped)", len(underlying), symbol, n_skip)
             
             return {
                 'holdings': underlying,
@@ -237,7 +249,7 @@ class HoldingsResolver:
             }
                     
         except Exception as e:
-            logger.error(f"Error resolving holdings for {symbol}: {e}")
+            logger.error("Error resolving holdings for %s: %s", symbol, e)
             logger.exception(e)
             return None
     
@@ -251,6 +263,8 @@ class HoldingsResolver:
             - 'verified_asset_type': Asset type confirmed by mstarpy
         """
         results = {}
+        n_ok = 0
+        n_skip = 0
         
         for holding in holdings:
             holding_id = holding['id']
@@ -258,19 +272,23 @@ class HoldingsResolver:
             asset_type = holding['asset_type']
             total_value = holding['total_value']
             
-            logger.info(f"Processing holding {holding_id}: {symbol} ({asset_type})")
+            logger.debug("Processing holding %s: %s (%s)", holding_id, symbol, asset_type)
             
             result = self.resolve_holding(symbol, asset_type, total_value)
             
             if result:
                 results[holding_id] = result
                 if result.get('holdings'):
-                    logger.info(f"Resolved {len(result['holdings'])} underlying holdings for {symbol}")
+                    n_ok += 1
+                    logger.debug("Resolved %d underlying holdings for %s", len(result['holdings']), symbol)
                 else:
-                    logger.warning(f"No underlying holdings found for {symbol}")
+                    n_skip += 1
+                    logger.debug("No underlying holdings found for %s", symbol)
             else:
-                logger.warning(f"Could not resolve holdings for {symbol}")
+                n_skip += 1
+                logger.debug("Could not resolve holdings for %s", symbol)
         
+        logger.info("Batch resolution: %d resolved, %d without holdings (of %d)", n_ok, n_skip, len(holdings))
         return results
 
 
@@ -402,6 +420,7 @@ def resolve_snapshot_holdings(snapshot_id: int) -> int:
     from app.database import db_session
     from app.models import Holding
     from app.services.resolution_tracker import start_resolution, update_progress, complete_resolution, log_error
+    from app.services.risk_aggregator import invalidate_risk_metrics_cache
     
     logger.info(f"Starting holdings resolution for snapshot {snapshot_id}")
     
@@ -474,6 +493,7 @@ def resolve_snapshot_holdings(snapshot_id: int) -> int:
                     log_error(holding.symbol, "Failed to resolve underlying holdings")
             
             session.commit()
+            invalidate_risk_metrics_cache()
             
             # Update tracker with actual underlying count now that we know it
             update_progress('etf_resolution', underlying_total=actual_underlying_count)
@@ -497,8 +517,10 @@ def resolve_snapshot_holdings(snapshot_id: int) -> int:
                 # Commit periodically to save progress
                 if idx % 10 == 0:
                     session.commit()
+                    invalidate_risk_metrics_cache()
             
             session.commit()
+            invalidate_risk_metrics_cache()
             logger.info(f"✓ Fetched and SAVED info for {info_fetched_count}/{len(holdings_needing_info)} parent holdings")
         
         # STEP 3: Fetch sector info for UNDERLYING holdings
@@ -527,6 +549,7 @@ def resolve_snapshot_holdings(snapshot_id: int) -> int:
                 
                 # Commit after each holding's underlying is processed
                 session.commit()
+                invalidate_risk_metrics_cache()
             
             logger.info(f"✓ Enriched and SAVED {underlying_enriched_count} total underlying holdings")
         
@@ -19,22 +19,115 @@ CHANGELOG:
 """
 from app.services.csv_parser_base import CSVParserBase
 import pandas as pd
-from typing import Dict, Optional, List
+import numpy as np
+from typing import Dict, Optional, List, Tuple
 from decimal import Decimal
+from functools import lru_cache
 import logging
 import re
-import tempfile
+import io
 import os
+import sys
+import mmap
 
 logger = logging.getLogger(__name__)
 
+# Max number of preprocessed DataFrames kept per parser instance
+PREPROCESS_CACHE_SIZE = 8
+
+# read_csv engine for the data section: 'c' (default) or 'pyarrow' (opt-in,
+# needs the optional pyarrow package from requirements.txt; falls back to
+# 'c' if pyarrow is missing or cannot parse the file)
+CSV_ENGINE = os.getenv('MERRILL_CSV_ENGINE', 'c')
+
+# Leading lines searched for the "Exported on:" timestamp
+EXPORT_SCAN_LINES = 10
+
+# Footer rows that are never holdings
+SKIP_SYMBOLS = frozenset({'TOTAL', 'BALANCES', 'CASH BALANCE', 'PENDING ACTIVITY', 'PENDING'})
+
+# Well-known ETF symbols for the resolver-less fallback
+COMMON_ETFS = frozenset({'VOO', 'VTI', 'SPY', 'QQQ', 'IVV', 'VEA', 'VWO', 'BND', 'AGG'})
+
+# Cash keywords - expanded to catch Merrill's various formats
+CASH_KEYWORDS = (
+    'CASH', 'MONEY MARKET', 'SWEEP', 'SETTLEMENT', 'CORE',
+    'FDIC', 'BANK DEPOSIT', 'CASH BALANCE', 'AVAILABLE CASH',
+    'UNINVESTED', 'PENDING', 'MONEY ACCOUNTS', 'BANK OF AMERICA',
+    'RASP', 'SAVINGS', 'CHECKING', 'DEPOSIT', 'MONEY ACCOUNT'
+)
+
+
+# Column aliases tried (in order) for each standard field
+COLUMN_ALIASES = {
+    'symbol': ('Symbol', 'Ticker', 'Security', 'Security Symbol'),
+    'description': ('Description', 'Security Description', 'Name', 'Security Name'),
+    'quantity': ('Quantity', 'Shares', 'Qty', 'Units'),
+    'price': ('Price', 'Last Price', 'Market Price', 'Current Price', 'Unit Price'),
+    'value': ('Value', 'Market Value', 'Total Value', 'Current Value', 'Amount'),
+    'account_type': ('Account Type', 'Type', 'Acct Type'),
+}
+REQUIRED_FIELDS = ('symbol', 'quantity', 'value')
+
+# Account Type keywords in priority order (first hit wins, so 'roth ira' -> 'ira')
+ACCOUNT_TYPE_KEYWORDS = (
+    ('ira', 'ira'),
+    ('roth', 'roth'),
+    ('401k', '401k'),
+    ('401(k)', '401k'),
+    ('taxable', 'taxable'),
+    ('individual', 'taxable'),
+)
+
+_CENTS = Decimal('0.01')
+
+
+def _to_decimal(value: float, places: int) -> Decimal:
+    """Convert a float64 result to Decimal (at least 2 places) at the output boundary"""
+    result = Decimal(str(round(float(value), places)))
+    return result.quantize(_CENTS) if result.as_tuple().exponent > -2 else result
+
+
+@lru_cache(maxsize=64)
+def _map_column_layout(columns: Tuple[str, ...]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Resolve COLUMN_ALIASES against a header layout (cached per layout)"""
+    return tuple(
+        (field, CSVParserBase.match_column(columns, aliases))
+        for field, aliases in COLUMN_ALIASES.items()
+    )
+
 
 class MerrillCSVParser(CSVParserBase):
     """Parser for Merrill Lynch CSV files"""
     
+    # All cash keywords as one alternation, compiled once for scalar and column checks
+    _CASH_RE = re.compile('|'.join(map(re.escape, CASH_KEYWORDS)))
+    # First run of digits/separators in a quantity or price cell
+    _NUM_RE = re.compile(r'([\d,.]+)')
+    # Everything that is not part of an account number
+    _ACCT_RE = re.compile(r'[^A-Z0-9]')
+    # Start of the column header line (Symbol, Description and Quantity on one line)
+    _HDR_RE = re.compile(rb'^(?=[^\n]*Symbol)(?=[^\n]*Description)(?=[^\n]*Quantity)', re.MULTILINE)
+    # Currency decoration dropped from value cells in a single pass
+    _CURRENCY_RE = re.compile(r'[$ ,()]')
+    # Parenthesized (negative) amount, ignoring '$' and spaces around it
+    _NEG_RE = re.compile(r'[$ ]*\(.*\)[$ ]*$')
+    # "Exported on: 01/25/2026 11:51 AM ET" and a bare date fallback
+    _EXPORTED_RE = re.compile(r'Exported on:\s*(\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)', re.IGNORECASE)
+    _DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+    # A whole cell holding a dollar amount ('$1,234.56'); group 1 is the number
+    _DOLLAR_RE = re.compile(r'\$\s*([\d,.]+)')
+    
     def __init__(self):
         super().__init__()
         self.broker_name = 'merrill'
+        # (realpath, mtime_ns, size) -> (preprocessed DataFrame, leading lines),
+        # shared by validate_csv/parse_csv/extract_export_timestamp
+        self._pp_cache: Dict[tuple, Tuple[pd.DataFrame, List[str]]] = {}
+        # Path whose data section is currently in self.df / self._head
+        self._last_path: Optional[str] = None
+        # First EXPORT_SCAN_LINES lines of _last_path
+        self._head: Optional[List[str]] = None
     
     def validate_csv(self, file_path: str) -> tuple[bool, Optional[str]]:
         """
@@ -43,6 +136,9 @@ class MerrillCSVParser(CSVParserBase):
         Merrill CSVs have a complex format with quoted sections.
         The actual data is in a section between double quotes.
         
+        Reads and caches the data section, so a following parse_csv on the
+        same file reuses the DataFrame instead of re-reading it.
+        
         Returns:
             tuple: (is_valid, error_message)
         """
@@ -53,19 +149,9 @@ class MerrillCSVParser(CSVParserBase):
             if df is None or len(df) == 0:
                 return False, "CSV file is empty or has no valid data section"
             
-            # Check for required columns (flexible matching)
-            symbol_col = self.find_column(df, ['Symbol', 'Ticker', 'Security'])
-            quantity_col = self.find_column(df, ['Quantity', 'Shares', 'Qty'])
-            value_col = self.find_column(df, ['Value', 'Market Value', 'Total Value', 'Current Value'])
-            
-            if not symbol_col:
-                return False, "Could not find Symbol/Ticker column"
-            
-            if not quantity_col:
-                return False, "Could not find Quantity/Shares column"
-            
-            if not value_col:
-                return False, "Could not find Value/Market Value column"
+            is_valid, error = self._validate_df(df)
+            if not is_valid:
+                return False, error
             
             logger.info(f"Merrill CSV validation passed: {len(df)} rows")
             return True, None
@@ -74,9 +160,84 @@ class MerrillCSVParser(CSVParserBase):
             logger.error(f"Merrill CSV validation failed: {e}")
             return False, str(e)
     
+    def _validate_df(self, df: pd.DataFrame) -> Tuple[bool, Optional[str]]:
+        """
+        Check an already-loaded data section for the required columns
+        
+        Args:
+            df: Preprocessed Merrill DataFrame
+            
+        Returns:
+            tuple: (is_valid, error_message)
+        """
+        # Check for required columns (flexible matching)
+        symbol_col = self.find_column(df, ['Symbol', 'Ticker', 'Security'])
+        quantity_col = self.find_column(df, ['Quantity', 'Shares', 'Qty'])
+        value_col = self.find_column(df, ['Value', 'Market Value', 'Total Value', 'Current Value'])
+        
+        if not symbol_col:
+            return False, "Could not find Symbol/Ticker column"
+        
+        if not quantity_col:
+            return False, "Could not find Quantity/Shares column"
+        
+        if not value_col:
+            return False, "Could not find Value/Market Value column"
+        
+        return True, None
+    
     def _preprocess_merrill_csv(self, file_path: str) -> Optional[pd.DataFrame]:
         """
-        Preprocess Merrill Lynch CSV to extract the data section
+        Preprocess Merrill Lynch CSV, reusing a cached result for an unchanged file
+        
+        validate_csv and parse_csv both need the extracted data section, so the
+        result is cached keyed on the file's real path, mtime and size. The
+        leading lines are kept with it for extract_export_timestamp.
+        
+        Returns:
+            pd.DataFrame: Extracted data or None
+        """
+        try:
+            st = os.stat(file_path)
+            key = (os.path.realpath(file_path), st.st_mtime_ns, st.st_size)
+        except OSError as e:
+            logger.error(f"Could not stat Merrill CSV {file_path}: {e}")
+            return None
+        
+        cached = self._pp_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Using cached preprocessed data for {file_path}")
+            self.df, self._head = cached
+            self._last_path = file_path
+            return self.df
+        
+        df = self._extract_data_section(file_path)
+        if df is not None:
+            if len(self._pp_cache) >= PREPROCESS_CACHE_SIZE:
+                # FIFO eviction - dicts preserve insertion order
+                self._pp_cache.pop(next(iter(self._pp_cache)))
+            self._pp_cache[key] = (df, self._head)
+        self._last_path = file_path if df is not None else None
+        return df
+    
+    @staticmethod
+    def _find_header(mm: mmap.mmap) -> Optional[int]:
+        """
+        Find the byte offset of the column header line
+        
+        The header line must have Symbol AND Description AND Quantity.
+        
+        Returns:
+            int: Offset of the start of the header line, or None
+        """
+        # One C-level regex pass over the mapped bytes; the lookaheads keep
+        # the original "all three on one line, any order" rule
+        match = MerrillCSVParser._HDR_RE.search(mm)
+        return match.start() if match else None
+    
+    def _extract_data_section(self, file_path: str) -> Optional[pd.DataFrame]:
+        """
+        Read the Merrill Lynch CSV and extract the data section
         
         Merrill CSVs have this structure:
         1. Account summary (skip)
@@ -92,103 +253,109 @@ class MerrillCSVParser(CSVParserBase):
         Returns:
             pd.DataFrame: Extracted data or None
         """
+        self._head = None
         try:
-            # Read entire file as text
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Log first 30 lines for debugging
-            logger.debug("First 30 lines of file:")
-            for i, line in enumerate(lines[:30]):
-                logger.debug(f"  [{i}]: {line.rstrip()[:100]}")
-            
-            # Find the header row (starts with "Symbol")
-            header_idx = None
-            data_start_idx = None
-            
-            for i, line in enumerate(lines):
-                # Look for the column header line - must have Symbol AND Description AND Quantity
-                if 'Symbol' in line and 'Description' in line and 'Quantity' in line:
-                    header_idx = i
-                    data_start_idx = i + 1
-                    logger.info(f"Found header at line {i}: {line.rstrip()[:80]}")
-                    break
-            
-            if header_idx is None:
-                logger.error("Could not find data section with Symbol/Description/Quantity columns")
-                return None
-            
-            # Find where data ends - ONLY stop at "Total" row, not "Balances"
-            # "Balances" is just a section marker, cash data follows it
-            data_end_idx = len(lines)
-            for i in range(data_start_idx, len(lines)):
-                line_stripped = lines[i].strip().strip('"').strip()
-                
-                # ONLY stop at "Total" row - this is the true footer
-                if line_stripped.startswith('Total'):
-                    data_end_idx = i
-                    logger.info(f"Found 'Total' footer at line {i}, stopping here")
-                    break
-            
-            # Extract header and data lines
-            header_line = lines[header_idx]
-            data_lines = lines[data_start_idx:data_end_idx]
-            
-            logger.info(f"Extracting lines {data_start_idx} to {data_end_idx} ({len(data_lines)} lines)")
-            
-            # Filter out:
-            # - Empty lines
-            # - Lines that are just commas
-            # - "Balances" marker row (no useful data)
-            # - "Cash balance" row (usually $0.00)
-            # - "Pending activity" row (usually $0.00)
-            # BUT KEEP "Money accounts" row - this has the actual cash!
-            filtered_lines = []
-            for line in data_lines:
-                line_stripped = line.strip()
-                
-                # Skip empty lines
-                if not line_stripped or line_stripped == ',' or line_stripped == '""':
-                    continue
-                
-                # Skip the "Balances" marker row (it's just a section header with no data)
-                if line_stripped.startswith('"Balances"'):
-                    logger.debug(f"Skipping Balances marker row")
-                    continue
-                
-                # Skip "Cash balance" if it's $0.00
-                if 'Cash balance' in line and '$0.00' in line:
-                    logger.debug(f"Skipping Cash balance row (zero value)")
-                    continue
-                
-                # Skip "Pending activity" if it's $0.00
-                if 'Pending activity' in line and '$0.00' in line:
-                    logger.debug(f"Skipping Pending activity row (zero value)")
-                    continue
-                
-                # Log if this is a Money accounts row
-                if 'Money accounts' in line:
-                    logger.info(f"Including Money accounts row: {line.rstrip()[:80]}")
-                
-                filtered_lines.append(line)
-            
-            logger.info(f"After filtering: {len(filtered_lines)} data lines")
-            
-            # Combine into CSV content
-            csv_content = header_line + ''.join(filtered_lines)
-            
-            logger.debug(f"CSV content (last 500 chars):\n{csv_content[-500:]}")
+            # Map the file and locate the header with C-level bytes.find instead of
+            # decoding every line; only the data section is decoded
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    logger.error("Merrill CSV file is empty")
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Log first 30 lines for debugging (skipped entirely unless
+                    # DEBUG is on, so no lines are decoded or formatted)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("First 30 lines of file:")
+                        for i in range(30):
+                            raw = mm.readline()
+                            if not raw:
+                                break
+                            logger.debug(f"  [{i}]: {raw.decode('utf-8', errors='replace').rstrip()[:100]}")
+                    
+                    # Keep the leading lines so the export timestamp can be read
+                    # without opening the file again
+                    mm.seek(0)
+                    head = []
+                    for _ in range(EXPORT_SCAN_LINES):
+                        raw = mm.readline()
+                        if not raw:
+                            break
+                        head.append(raw.decode('utf-8', errors='replace'))
+                    self._head = head
+                    
+                    header_start = self._find_header(mm)
+                    if header_start is None:
+                        logger.error("Could not find data section with Symbol/Description/Quantity columns")
+                        return None
+                    
+                    mm.seek(header_start)
+                    header_line = mm.readline().decode('utf-8')
+                    logger.info(f"Found header at byte {header_start}: {header_line.rstrip()[:80]}")
+                    
+                    # Single forward pass: stop at the footer and filter in the same loop.
+                    # ONLY stop at "Total" row, not "Balances" - "Balances" is just a
+                    # section marker, cash data follows it.
+                    # Filter out:
+                    # - Empty lines
+                    # - Lines that are just commas
+                    # - "Balances" marker row (no useful data)
+                    # - "Cash balance" row (usually $0.00)
+                    # - "Pending activity" row (usually $0.00)
+                    # BUT KEEP "Money accounts" row - this has the actual cash!
+                    # Lines are pulled from the map one at a time, so nothing past the
+                    # footer is decoded and memory stays bounded by the data section.
+                    # Accepted lines go straight into the buffer pandas reads from
+                    buf = io.StringIO()
+                    buf.write(header_line)
+                    data_lines = 0
+                    kept_lines = 0
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                    for raw in iter(mm.readline, b''):
+                        line = raw.decode('utf-8')
+                        data_lines += 1
+                        line_stripped = line.strip()
+                        label = line_stripped.lstrip('"').lstrip()
+                        
+                        # Skip empty lines
+                        if not line_stripped or line_stripped == ',' or line_stripped == '""':
+                            continue
+                        
+                        # ONLY stop at "Total" row - this is the true footer
+                        if label.startswith('Total'):
+                            logger.info(f"Found 'Total' footer {data_lines} lines after header, stopping here")
+                            break
+                        
+                        # Skip the "Balances" marker row (it's just a section header with no data)
+                        if line_stripped.startswith('"Balances"'):
+                            logger.debug("Skipping Balances marker row")
+                            continue
+                        
+                        # Skip "Cash balance" / "Pending activity" if it's $0.00 (the
+                        # label may sit in any column, so match anywhere in the line)
+                        if '$0.00' in line and ('Cash balance' in line or 'Pending activity' in line):
+                            if debug_enabled:
+                                logger.debug(f"Skipping zero-value row: {label[:20]}")
+                            continue
+                        
+                        # Log if this is a Money accounts row
+                        if 'Money accounts' in line:
+                            logger.info(f"Including Money accounts row: {line.rstrip()[:80]}")
+                        
+                        buf.write(line)
+                        kept_lines += 1
             
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as tmp:
-                tmp.write(csv_content)
-                tmp_path = tmp.name
+            logger.info(f"After filtering: {kept_lines} data lines")
             
-            # Load as DataFrame
-            df = pd.read_csv(tmp_path, skipinitialspace=True, on_bad_lines='warn')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"CSV content (last 500 chars):\n{buf.getvalue()[-500:]}")
             
-            # Clean up temp file
-            os.unlink(tmp_path)
+            # Load as DataFrame straight from memory (no temp file round trip).
+            # Every cell is read as str: all numeric cleanup happens column-wise
+            # in _parse_holdings, so pandas type inference would be wasted work.
+            # All columns are kept - Money accounts rows carry their amount in
+            # arbitrary columns, so usecols can't be narrowed to the mapping.
+            buf.seek(0)
+            df = self._read_data_section(buf)
             
             # Strip whitespace from column names
             df.columns = df.columns.str.strip()
@@ -196,15 +363,15 @@ class MerrillCSVParser(CSVParserBase):
             # Remove any empty rows
             df = df.dropna(how='all')
             
-            # Log what we got
-            if 'Symbol' in df.columns:
-                logger.info(f"Symbols in parsed DataFrame: {list(df['Symbol'].values)}")
-            
             logger.info(f"Extracted Merrill data section: {len(df)} rows, {len(df.columns)} columns")
             
-            if len(df) > 0:
-                logger.debug(f"First row: {df.iloc[0].to_dict()}")
-                logger.debug(f"Last row: {df.iloc[-1].to_dict()}")
+            # Row dumps build a list/dict per call, so only when DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                if 'Symbol' in df.columns:
+                    logger.debug(f"Symbols in parsed DataFrame: {df['Symbol'].tolist()}")
+                if len(df) > 0:
+                    logger.debug(f"First row: {df.iloc[0].to_dict()}")
+                    logger.debug(f"Last row: {df.iloc[-1].to_dict()}")
             
             self.df = df
             return df
@@ -216,6 +383,37 @@ class MerrillCSVParser(CSVParserBase):
             return None    
 
 
+    def _read_data_section(self, buf: io.StringIO) -> pd.DataFrame:
+        """
+        Run read_csv over the filtered data section
+        
+        The C engine is pinned so an option change never silently drops to the
+        python engine. With MERRILL_CSV_ENGINE=pyarrow the Arrow reader is
+        tried first; it has no skipinitialspace and keeps empty cells as '',
+        so both are normalized to match the C engine's output.
+        
+        Args:
+            buf: Header line plus accepted data lines, positioned at 0
+            
+        Returns:
+            pd.DataFrame: All cells as str, NaN for empty
+        """
+        if CSV_ENGINE == 'pyarrow':
+            try:
+                import pyarrow
+            except ImportError:
+                logger.warning("pyarrow is not installed, using the C CSV engine")
+            else:
+                try:
+                    df = pd.read_csv(buf, engine='pyarrow', dtype=str)
+                    return df.apply(lambda col: col.str.lstrip()).replace('', np.nan)
+                except (pyarrow.ArrowInvalid, pd.errors.ParserError) as e:
+                    # e.g. ragged Money accounts rows, which the C engine tolerates
+                    logger.warning(f"pyarrow CSV engine failed ({e}), using the C CSV engine")
+                buf.seek(0)
+        
+        return pd.read_csv(buf, skipinitialspace=True, on_bad_lines='warn', dtype=str, engine='c')
+    
     def extract_account_number(self, df: pd.DataFrame) -> Optional[str]:
         """
         Extract account number from Merrill Lynch CSV
@@ -232,7 +430,7 @@ class MerrillCSVParser(CSVParserBase):
             if account_col and not df[account_col].isna().all():
                 account = df[account_col].dropna().iloc[0] if len(df[account_col].dropna()) > 0 else None
                 if account:
-                    alnum = re.sub(r'[^A-Z0-9]', '', str(account).upper())
+                    alnum = self._ACCT_RE.sub('', str(account).upper())
                     if len(alnum) >= 4:
                         return alnum[-4:]
         
@@ -254,38 +452,38 @@ class MerrillCSVParser(CSVParserBase):
         try:
             from datetime import datetime
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Read first few lines to find the export timestamp
-                for _ in range(10):  # Check first 10 lines
-                    line = f.readline()
-                    if not line:
-                        break
-                    
-                    # Look for "Exported on:" pattern
-                    if 'Exported on:' in line or 'exported on:' in line.lower():
-                        # Extract the date/time portion
-                        # Pattern: "Exported on: 01/25/2026 11:51 AM ET"
-                        match = re.search(r'Exported on:\s*(\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)', line, re.IGNORECASE)
-                        if match:
-                            date_str = match.group(1).strip()
-                            # Try to parse with various formats
-                            for fmt in ['%m/%d/%Y %I:%M %p', '%m/%d/%Y %H:%M', '%m/%d/%Y']:
-                                try:
-                                    dt = datetime.strptime(date_str, fmt)
-                                    logger.info(f"Extracted export timestamp: {dt.isoformat()}")
-                                    return dt.isoformat()
-                                except ValueError:
-                                    continue
-                        
-                        # Try simpler date extraction
-                        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', line)
-                        if date_match:
+            # Reuse the lines read during preprocessing when available
+            if self._head is not None and self._last_path == file_path:
+                head = self._head
+            else:
+                head = self._read_head(file_path)
+            
+            for line in head:
+                # Look for "Exported on:" pattern
+                if 'Exported on:' in line or 'exported on:' in line.lower():
+                    # Extract the date/time portion
+                    # Pattern: "Exported on: 01/25/2026 11:51 AM ET"
+                    match = self._EXPORTED_RE.search(line)
+                    if match:
+                        date_str = match.group(1).strip()
+                        # Try to parse with various formats
+                        for fmt in ['%m/%d/%Y %I:%M %p', '%m/%d/%Y %H:%M', '%m/%d/%Y']:
                             try:
-                                dt = datetime.strptime(date_match.group(1), '%m/%d/%Y')
-                                logger.info(f"Extracted export date: {dt.isoformat()}")
+                                dt = datetime.strptime(date_str, fmt)
+                                logger.info(f"Extracted export timestamp: {dt.isoformat()}")
                                 return dt.isoformat()
                             except ValueError:
-                                pass
+                                continue
+                    
+                    # Try simpler date extraction
+                    date_match = self._DATE_RE.search(line)
+                    if date_match:
+                        try:
+                            dt = datetime.strptime(date_match.group(1), '%m/%d/%Y')
+                            logger.info(f"Extracted export date: {dt.isoformat()}")
+                            return dt.isoformat()
+                        except ValueError:
+                            pass
             
             logger.warning("Could not extract export timestamp from CSV")
             return None
@@ -294,6 +492,25 @@ class MerrillCSVParser(CSVParserBase):
             logger.error(f"Error extracting export timestamp: {e}")
             return None
     
+    def _read_head(self, file_path: str) -> List[str]:
+        """
+        Read the first EXPORT_SCAN_LINES lines of a file
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            List[str]: Leading lines (fewer for short files)
+        """
+        head = []
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for _ in range(EXPORT_SCAN_LINES):
+                line = f.readline()
+                if not line:
+                    break
+                head.append(line)
+        return head
+    
     def parse_csv(self, file_path: str) -> Dict:
         """
         Parse Merrill Lynch CSV file
@@ -311,15 +528,24 @@ class MerrillCSVParser(CSVParserBase):
                 'export_timestamp': str (ISO format) or None
             }
         """
-        # Extract export timestamp BEFORE preprocessing (needs raw file)
-        export_timestamp = self.extract_export_timestamp(file_path)
-        
-        # Preprocess and load CSV
-        df = self._preprocess_merrill_csv(file_path)
+        # Reuse the frame validate_csv just loaded (a parser instance handles
+        # one upload, so the path is enough); otherwise preprocess and load
+        if self.df is not None and self._last_path == file_path:
+            df = self.df
+        else:
+            df = self._preprocess_merrill_csv(file_path)
         
         if df is None:
             raise ValueError("Could not extract data from Merrill Lynch CSV")
         
+        # Export timestamp comes from the leading lines kept by preprocessing
+        export_timestamp = self.extract_export_timestamp(file_path)
+        
+        # Validate the same DataFrame rather than going back to the file
+        is_valid, error = self._validate_df(df)
+        if not is_valid:
+            raise ValueError(error)
+        
         # Extract account number
         account_number = self.extract_account_number(df)
         
@@ -329,25 +555,10 @@ class MerrillCSVParser(CSVParserBase):
         if not columns:
             raise ValueError("Could not map required columns in Merrill Lynch CSV")
         
-        # Parse holdings
-        holdings = []
-        cash_holdings = []
-        total_value = Decimal('0.00')
-        total_cash = Decimal('0.00')
-        
-        for idx, row in df.iterrows():
-            try:
-                holding = self._parse_row(row, columns)
-                if holding and holding['total_value'] > 0:
-                    if holding['asset_type'] == 'cash':
-                        cash_holdings.append(holding)
-                        total_cash += holding['total_value']
-                    else:
-                        holdings.append(holding)
-                    total_value += holding['total_value']
-            except Exception as e:
-                logger.warning(f"Error parsing row {idx}: {e}")
-                continue
+        # Parse holdings (totals are reduced over float64 arrays)
+        parsed, total_value, total_cash = self._parse_holdings(df, columns)
+        holdings = [h for h in parsed if h['asset_type'] != 'cash']
+        cash_holdings = [h for h in parsed if h['asset_type'] == 'cash']
         
         logger.info(f"Parsed {len(holdings)} investment holdings and {len(cash_holdings)} cash holdings")
         logger.info(f"Total value: ${total_value}, Cash: ${total_cash}")
@@ -373,249 +584,215 @@ class MerrillCSVParser(CSVParserBase):
         Returns:
             dict: Mapping of standard names to actual column names
         """
-        mapping = {}
-        
-        mapping['symbol'] = self.find_column(df, [
-            'Symbol', 'Ticker', 'Security', 'Security Symbol'
-        ])
-        
-        mapping['description'] = self.find_column(df, [
-            'Description', 'Security Description', 'Name', 'Security Name'
-        ])
-        
-        mapping['quantity'] = self.find_column(df, [
-            'Quantity', 'Shares', 'Qty', 'Units'
-        ])
+        # Merrill exports share a handful of layouts, so the alias search is
+        # memoized on the header tuple across validate/parse and across files
+        mapping = dict(_map_column_layout(tuple(df.columns)))
         
-        mapping['price'] = self.find_column(df, [
-            'Price', 'Last Price', 'Market Price', 'Current Price', 'Unit Price'
-        ])
-        
-        mapping['value'] = self.find_column(df, [
-            'Value', 'Market Value', 'Total Value', 'Current Value', 'Amount'
-        ])
-        
-        mapping['account_type'] = self.find_column(df, [
-            'Account Type', 'Type', 'Acct Type'
-        ])
-        
-        required = ['symbol', 'quantity', 'value']
-        if not all(mapping.get(field) for field in required):
+        if not all(mapping.get(field) for field in REQUIRED_FIELDS):
             logger.error(f"Missing required columns. Mapped: {mapping}")
             return None
         
         logger.info(f"Column mapping: {mapping}")
         return mapping
     
-    def _parse_row(self, row: pd.Series, columns: Dict[str, str]) -> Optional[Dict]:
+    def _parse_holdings(self, df: pd.DataFrame, columns: Dict[str, str]) -> Tuple[List[Dict], Decimal, Decimal]:
         """
-        Parse a single row into a holding
+        Parse all data rows into holdings with column-wise pandas operations
+        
+        Symbols, numbers and the cash mask are computed once per column; only
+        the rows that survive the filters are turned into holding dicts, with
+        Decimal conversion happening at that boundary.
+        
+        Cells are already str (read with dtype=str), so after fillna('') the
+        .str accessors run directly without an astype(str) copy per column.
         
         Args:
-            row: DataFrame row
+            df: Preprocessed data section
             columns: Column mapping
             
         Returns:
-            dict: Holding data or None if invalid
+            tuple: (holdings in file order, total_value, total_cash)
         """
-        # Extract symbol
-        symbol_raw = row[columns['symbol']]
-        symbol = self.normalize_symbol(symbol_raw)
+        # Same result as normalize_symbol, but one vectorized pass per column
+        symbol = df[columns['symbol']].fillna('').str.strip().str.upper()
         
-        # SKIP special footer rows (Total, Balances, etc.)
-        symbol_upper = symbol.upper() if symbol else ''
-        skip_symbols = {'TOTAL', 'BALANCES', 'CASH BALANCE', 'PENDING ACTIVITY', 'PENDING'}
-        if symbol_upper in skip_symbols:
-            logger.debug(f"Skipping footer row: {symbol_upper}")
-            return None
+        # SKIP special footer rows (Total, Balances, etc.) - exact labels, so a
+        # set lookup rather than a regex
+        keep = ~symbol.isin(SKIP_SYMBOLS)
+        df = df[keep]
+        symbol = symbol[keep]
         
-        # Extract description for cash detection
-        description = ''
-        if columns.get('description') and not pd.isna(row[columns['description']]):
-            description = str(row[columns['description']]).strip()
-        
-        # Check if this is a cash holding BEFORE rejecting empty symbols
-        is_cash = self._is_cash_holding(symbol, description)
-        
-        # Debug logging for potential cash rows
-        if is_cash or (symbol and 'MONEY' in str(symbol).upper()):
-            logger.info(f"Potential cash row detected:")
-            logger.info(f"  Symbol: {symbol}")
-            logger.info(f"  Description: {description}")
-            logger.info(f"  is_cash: {is_cash}")
-            logger.info(f"  Full row: {row.to_dict()}")
-        
-        # Special handling for "Money accounts" rows in Merrill CSVs
-        # These have a different column structure - "Money accounts" is in the Symbol field
-        if symbol and 'MONEY ACCOUNT' in symbol.upper():
-            logger.info(f"Processing Money accounts row...")
-            # The value is typically in a different position for these rows
-            # Try to find a dollar value in the row
-            found_value = None
-            for col_name, value in row.items():
-                if pd.notna(value):
-                    val_str = str(value).strip()
-                    # Look for a dollar amount that's not $0.00
-                    if val_str.startswith('$') and val_str != '$0.00':
-                        val_cleaned = val_str.replace('$', '').replace(',', '').strip()
-                        try:
-                            val_amount = Decimal(val_cleaned)
-                            if val_amount > 0:
-                                found_value = val_amount
-                                logger.info(f"  Found cash value in column '{col_name}': ${val_amount}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"  Could not parse '{val_str}' as decimal: {e}")
-                            continue
-            
-            if found_value:
-                result = {
-                    'symbol': 'CASH',
-                    'name': description or 'Cash / Money Market',
-                    'quantity': Decimal('1.00'),
-                    'price': found_value,
-                    'total_value': found_value,
-                    'asset_type': 'cash',
-                    'account_type': None
-                }
-                logger.info(f"  ✓ Created cash holding: ${found_value}")
-                return result
-            else:
-                logger.warning(f"  ✗ Could not find valid cash value in Money accounts row")
-                return None
+        if df.empty:
+            return [], Decimal('0.00'), Decimal('0.00')
         
-        if not symbol or symbol == '' or symbol == 'N/A':
-            if is_cash:
-                # Generate a synthetic symbol for cash
-                symbol = 'CASH'
-            else:
-                return None
-        
-        # Extract quantity
-        quantity_str = str(row[columns['quantity']])
-        quantity_match = re.search(r'[\d,.]+', quantity_str)
-        if quantity_match:
-            quantity = self.clean_quantity(quantity_match.group(0))
+        # Extract description for cash detection
+        if columns.get('description'):
+            description = df[columns['description']].fillna('').str.strip()
         else:
-            quantity = self.clean_quantity(quantity_str)
+            description = pd.Series('', index=df.index)
+        
+        # Upper-case once per column (symbols are already upper-cased by
+        # normalize_symbol) and reuse for every keyword check below
+        desc_upper = description.str.upper()
+        
+        # Cash detection runs BEFORE rejecting empty symbols
+        # (two scans rather than one over a concatenated symbol+description
+        # column, which would allocate a new string per row)
+        is_cash = symbol.str.contains(self._CASH_RE) | desc_upper.str.contains(self._CASH_RE)
+        
+        # "Money accounts" rows carry the cash amount in an arbitrary column
+        is_money = symbol.str.contains('MONEY ACCOUNT', regex=False)
+        is_cash = is_cash | is_money
+        
+        quantity = self._extract_number(df[columns['quantity']])
+        
+        # Merrill values may use odd thousands separators ($14,80.76), so all
+        # commas are dropped; parentheses mean negative. Empty cells stay NaN.
+        value_raw = df[columns['value']]
+        value_str = value_raw.fillna('')
+        is_negative = value_str.str.match(self._NEG_RE)
+        value = pd.to_numeric(value_str.str.replace(self._CURRENCY_RE, '', regex=True), errors='coerce').fillna(0.0)
+        value = value.where(~is_negative, -value).where(value_raw.notna())
+        
+        # For cash with $0 in the value column (or Money accounts rows), look
+        # for the real dollar amount elsewhere in the row
+        needs_scan = is_money | (is_cash & (value == 0))
+        if needs_scan.any():
+            value_pos = df.columns.get_loc(columns['value'])
+            rows = df.to_numpy(dtype=object)
+            for pos in np.flatnonzero(needs_scan.to_numpy()):
+                money = is_money.iat[pos]
+                found = self._find_dollar_value(rows[pos], skip=None if money else value_pos)
+                if found is not None:
+                    logger.info(f"Found cash value for {symbol.iat[pos] or 'CASH'}: ${found}")
+                    value.iat[pos] = found
+                elif money:
+                    logger.warning("Could not find valid cash value in Money accounts row")
+                    value.iat[pos] = 0.0
+        
+        # Numeric work happens on float64 arrays; Decimal only at the output
+        cash = is_cash.to_numpy()
+        qty = quantity.to_numpy(dtype=np.float64)
+        val = value.to_numpy(dtype=np.float64)
+        
+        has_symbol = ~symbol.isin(('', 'N/A')).to_numpy()
+        valid = (has_symbol | cash) & (cash | (qty != 0)) & (val != 0)
         
-        # For cash, quantity might be 0 or 1 - that's okay
-        if quantity == 0 and not is_cash:
-            return None
-        
-        # For cash with 0 quantity, set to 1
-        if quantity == 0 and is_cash:
-            quantity = Decimal('1.00')
-        
-        # Extract total value
-        value_str = str(row[columns['value']])
-        value_cleaned = value_str.replace('$', '').replace(' ', '').strip()
-        
-        # Fix Merrill number format
-        if ',' in value_cleaned and '.' in value_cleaned:
-            parts = value_cleaned.split('.')
-            if len(parts) == 2:
-                integer_part = parts[0].replace(',', '')
-                value_cleaned = f"{integer_part}.{parts[1]}"
-        
-        total_value = self.clean_currency(value_cleaned)
-        
-        # For cash with $0 in value column, try to find the real value elsewhere
-        if total_value == 0 and is_cash:
-            for col_name, value in row.items():
-                if pd.notna(value) and col_name != columns['value']:
-                    val_str = str(value).strip()
-                    if val_str.startswith('$') and val_str != '$0.00':
-                        val_cleaned = val_str.replace('$', '').replace(',', '').strip()
-                        try:
-                            val_amount = Decimal(val_cleaned)
-                            if val_amount > 0:
-                                total_value = val_amount
-                                logger.info(f"Found alternate cash value: ${total_value}")
-                                break
-                        except:
-                            continue
+        # For cash, price equals value (1 unit)
+        qty = np.where(cash, 1.0, qty)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price = np.where(cash, val, np.where(qty != 0, val / qty, 0.0))
+        
+        # If price column exists, use it (but not for cash)
+        if columns.get('price'):
+            price_col = self._extract_number(df[columns['price']]).to_numpy(dtype=np.float64)
+            use_col = ~cash & (price_col > 0)
+            price = np.where(use_col, price_col, price)
+            val = np.where(use_col, price_col * qty, val)
+        
+        valid &= val > 0
+        
+        if columns.get('account_type'):
+            account_type_raw = df[columns['account_type']].fillna('').str.strip().str.lower()
+            # An account has one type repeated on every row: classify each
+            # distinct value once
+            classified = {v: self._classify_account_type(v) for v in account_type_raw.unique()}
+            account_type = [classified[v] for v in account_type_raw]
+        else:
+            account_type = [None] * len(df)
         
-        if total_value == 0:
-            return None
+        # Plain lists/arrays for the row loop: positional indexing into them
+        # avoids the per-call overhead of Series.iat
+        symbols = symbol.tolist()
+        descriptions = description.tolist()
+        money_rows = is_money.to_numpy()
         
-        # Calculate price
-        price = total_value / quantity if quantity != 0 else Decimal('0.00')
+        # The same symbol can appear on several lots; resolve each
+        # (symbol, description) once per file, since a resolver miss may go
+        # out to yfinance
+        asset_types: Dict[Tuple[str, str], str] = {}
         
-        # For cash, price equals value (1 unit)
-        if is_cash:
-            price = total_value
-            quantity = Decimal('1.00')
-        
-        # If price column exists, try to use it (but not for cash)
-        if not is_cash and columns.get('price') and not pd.isna(row[columns['price']]):
-            price_str = str(row[columns['price']])
-            price_match = re.search(r'[\d,.]+', price_str)
-            if price_match:
-                price_from_col = self.clean_currency(price_match.group(0))
-                if price_from_col > 0:
-                    price = price_from_col
-                    total_value = price * quantity
-        
-        # Detect asset type
-        if is_cash:
-            asset_type = 'cash'
-        else:
-            asset_type = self.detect_asset_type(symbol, description)
-        
-        # Extract account type
-        account_type = None
-        if columns.get('account_type') and not pd.isna(row[columns['account_type']]):
-            account_type_raw = str(row[columns['account_type']]).strip().lower()
-            if 'ira' in account_type_raw:
-                account_type = 'ira'
-            elif 'roth' in account_type_raw:
-                account_type = 'roth'
-            elif '401k' in account_type_raw or '401(k)' in account_type_raw:
-                account_type = '401k'
-            elif 'taxable' in account_type_raw or 'individual' in account_type_raw:
-                account_type = 'taxable'
+        holdings = []
+        for i in np.flatnonzero(valid).tolist():
+            sym = symbols[i]
+            desc = descriptions[i]
+            acct = account_type[i]
+            if money_rows[i]:
+                name = desc or 'Cash / Money Market'
+                sym = 'CASH'
+                acct = None
+            else:
+                if not sym or sym == 'N/A':
+                    # Generate a synthetic symbol for cash
+                    sym = 'CASH'
+                name = desc or sym
+            
+            # asset_type/account_type have a handful of values: keep one shared
+            # string object each. Literals (and ACCOUNT_TYPE_KEYWORDS) are
+            # already interned; resolver results may come from the JSON cache.
+            if cash[i]:
+                asset_type = 'cash'
+            else:
+                asset_type = asset_types.get((sym, desc))
+                if asset_type is None:
+                    asset_type = sys.intern(self.detect_asset_type(sym, desc))
+                    asset_types[(sym, desc)] = asset_type
+            
+            holdings.append({
+                'symbol': sym,
+                'name': name,
+                'quantity': _to_decimal(qty[i], 6),
+                'price': _to_decimal(price[i], 4),
+                'total_value': _to_decimal(val[i], 2),
+                'asset_type': asset_type,
+                'account_type': acct
+            })
+        
+        total_value = _to_decimal(val[valid].sum(), 2)
+        total_cash = _to_decimal(val[valid & cash].sum(), 2)
+        return holdings, total_value, total_cash
+    
+    def _extract_number(self, series: pd.Series) -> pd.Series:
+        """
+        Pull the first number out of each cell (e.g. '$0.00 0.00%' -> 0.0)
         
-        return {
-            'symbol': symbol,
-            'name': description or symbol,
-            'quantity': quantity,
-            'price': price,
-            'total_value': total_value,
-            'asset_type': asset_type,
-            'account_type': account_type
-        }
+        Returns:
+            pd.Series: float64 values, 0.0 where nothing parseable was found
+        """
+        extracted = series.fillna('').str.extract(self._NUM_RE, expand=False)
+        return pd.to_numeric(extracted.str.replace(',', '', regex=False), errors='coerce').fillna(0.0)
     
-    def _is_cash_holding(self, symbol: str, description: str) -> bool:
+    def _find_dollar_value(self, values, skip: Optional[int] = None) -> Optional[float]:
         """
-        Determine if a row represents a cash holding
+        Find the first non-zero dollar amount ('$1,234.56') in a row
         
         Args:
-            symbol: The symbol (may be empty for cash, or contain cash identifiers like "Money accounts")
-            description: The description field
+            values: Row values in column order
+            skip: Column position to ignore
             
         Returns:
-            bool: True if this is a cash holding
+            float: Amount, or None if the row has no positive dollar value
         """
-        symbol_upper = symbol.upper() if symbol else ''
-        desc_upper = description.upper() if description else ''
-        
-        # Combined text for keyword search
-        combined = f"{symbol_upper} {desc_upper}"
-        
-        # Cash keywords - expanded to catch Merrill's various formats
-        cash_keywords = [
-            'CASH', 'MONEY MARKET', 'SWEEP', 'SETTLEMENT', 'CORE',
-            'FDIC', 'BANK DEPOSIT', 'CASH BALANCE', 'AVAILABLE CASH',
-            'UNINVESTED', 'PENDING', 'MONEY ACCOUNTS', 'BANK OF AMERICA',
-            'RASP', 'SAVINGS', 'CHECKING', 'DEPOSIT', 'MONEY ACCOUNT'
-        ]
-        
-        for keyword in cash_keywords:
-            if keyword in combined:
-                return True
-        
-        return False
+        for pos, value in enumerate(values):
+            # Cells are str (dtype=str read) or NaN for empty
+            if pos == skip or not isinstance(value, str):
+                continue
+            match = self._DOLLAR_RE.fullmatch(value.strip())
+            if match:
+                try:
+                    amount = float(match.group(1).replace(',', ''))
+                except ValueError:
+                    continue
+                if amount > 0:
+                    return amount
+        return None
+    
+    def _classify_account_type(self, account_type_raw: str) -> Optional[str]:
+        """Map a lower-cased Account Type cell to 'ira', 'roth', '401k' or 'taxable'"""
+        for keyword, account_type in ACCOUNT_TYPE_KEYWORDS:
+            if keyword in account_type_raw:
+                return account_type
+        return None
     
     def detect_asset_type(self, symbol: str, description: str) -> str:
         """
@@ -654,8 +831,7 @@ class MerrillCSVParser(CSVParserBase):
             return 'bond'
         
         # Symbol patterns
-        common_etfs = {'VOO', 'VTI', 'SPY', 'QQQ', 'IVV', 'VEA', 'VWO', 'BND', 'AGG'}
-        if symbol_upper in common_etfs:
+        if symbol_upper in COMMON_ETFS:
             return 'etf'
         
         if len(symbol_upper) == 5 and symbol_upper.endswith('X'):
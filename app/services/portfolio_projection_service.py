@@ -16,6 +16,7 @@ from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import json
 from pathlib import Path
 
@@ -30,6 +31,17 @@ RISK_FREE_RATE = 0.04  # 4%
 # Historical inflation rate for real returns
 INFLATION_RATE = 0.03  # 3%
 
+# Minimum monthly closes needed for the return statistics (fund or SPY)
+MIN_HISTORY_MONTHS = 24
+
+# Max concurrent per-fund history fetches when the batched download misses
+RISK_FETCH_WORKERS = 10
+
+# Monte Carlo projection defaults
+MONTE_CARLO_PATHS = 10000
+# Percentiles matching the analytic scenarios: +1, 0, -1 and -2 std dev
+MONTE_CARLO_PERCENTILES = (84.13, 50.0, 15.87, 2.28)
+
 
 @dataclass
 class FundRiskMetrics:
@@ -59,6 +71,10 @@ class PortfolioProjectionService:
     
     def __init__(self):
         self.cache = self._load_cache()
+        # Set when self.cache has entries not yet written to disk
+        self._dirty = False
+        # SPY cache key -> monthly closes, so the benchmark is decoded/fetched once
+        self._spy_closes: Dict[str, pd.Series] = {}
     
     def _load_cache(self) -> Dict:
         """Load projection cache"""
@@ -80,10 +96,122 @@ class PortfolioProjectionService:
             self.cache['timestamp'] = datetime.now().timestamp()
             with open(PROJECTION_CACHE_FILE, 'w') as f:
                 json.dump(self.cache, f, indent=2)
+            self._dirty = False
         except Exception as e:
             logger.warning(f"Error saving projection cache: {e}")
     
-    def get_fund_risk_metrics(self, symbol: str, portfolio_value: float, fund_name: str = "", lookback_years: int = 5) -> Optional[FundRiskMetrics]:
+    def _fetch_closes(self, symbols: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.Series]:
+        """
+        Download monthly closes for several tickers in one batched request
+        
+        Args:
+            symbols: Ticker symbols
+            start_date: Start of the history window
+            end_date: End of the history window
+            
+        Returns:
+            Dict of symbol -> Close series (symbols with no data are omitted)
+        """
+        try:
+            data = yf.download(
+                symbols,
+                start=start_date,
+                end=end_date,
+                interval="1mo",
+                group_by="ticker",
+                auto_adjust=True,  # same prices as Ticker.history()
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            logger.warning(f"Batched history download failed: {e}")
+            return {}
+        
+        closes = {}
+        if data is None or data.empty:
+            return closes
+        
+        for symbol in symbols:
+            try:
+                series = data[symbol]['Close'].dropna()
+            except KeyError:
+                continue
+            if not series.empty:
+                closes[symbol] = series
+        return closes
+    
+    @staticmethod
+    def _month_index(closes: pd.Series) -> pd.Series:
+        """Re-index closes by tz-naive date so history(), download() and cached data align"""
+        index = pd.DatetimeIndex(closes.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return pd.Series(closes.to_numpy(dtype=np.float64), index=index.normalize())
+    
+    def _load_spy_closes(self, lookback_years: int, end_date: datetime) -> Optional[pd.Series]:
+        """
+        SPY closes from memory or the on-disk cache
+        
+        The key includes the end date, so cached benchmark data lives for a day.
+        
+        Returns:
+            pd.Series of monthly closes, or None on a miss
+        """
+        key = f"spy_{lookback_years}y_{end_date.date().isoformat()}"
+        if key not in self._spy_closes:
+            cached = self.cache.get(key)
+            # Treat a short entry (a failed fetch stored by older code) as a miss
+            if not cached or len(cached.get('closes', ())) < MIN_HISTORY_MONTHS:
+                return None
+            self._spy_closes[key] = pd.Series(cached['closes'], index=pd.to_datetime(cached['dates']))
+        return self._spy_closes[key]
+    
+    def _store_spy_closes(self, lookback_years: int, end_date: datetime, closes: pd.Series):
+        """Keep SPY closes in memory and in the projection cache (written on next save)"""
+        closes = self._month_index(closes)
+        prefix = f"spy_{lookback_years}y_"
+        key = f"{prefix}{end_date.date().isoformat()}"
+        
+        # Drop previous days' benchmark data for this lookback
+        for stale in [k for k in self.cache if k.startswith(prefix) and k != key]:
+            del self.cache[stale]
+        
+        self.cache[key] = {
+            'dates': closes.index.strftime('%Y-%m-%d').tolist(),
+            'closes': closes.tolist()
+        }
+        self._spy_closes[key] = closes
+        self._dirty = True
+    
+    def _get_spy_closes(self, start_date: datetime, end_date: datetime, lookback_years: int) -> Optional[pd.Series]:
+        """
+        Monthly SPY closes for the benchmark, cached for the day
+        
+        Returns:
+            pd.Series of monthly closes, or None if the fetch came back short
+            (yfinance returns an empty frame when rate limited); short results
+            are not cached, so the next call retries
+        """
+        closes = self._load_spy_closes(lookback_years, end_date)
+        if closes is None:
+            spy_hist = yf.Ticker("SPY").history(start=start_date, end=end_date, interval="1mo")
+            if spy_hist is None or len(spy_hist) < MIN_HISTORY_MONTHS:
+                logger.warning("Insufficient SPY benchmark data")
+                return None
+            self._store_spy_closes(lookback_years, end_date, spy_hist['Close'])
+            closes = self._load_spy_closes(lookback_years, end_date)
+        return closes
+    
+    def get_fund_risk_metrics(
+        self,
+        symbol: str,
+        portfolio_value: float,
+        fund_name: str = "",
+        lookback_years: int = 5,
+        closes: Optional[pd.Series] = None,
+        spy_closes: Optional[pd.Series] = None,
+        save: bool = True
+    ) -> Optional[FundRiskMetrics]:
         """
         Get risk metrics for a single fund
         
@@ -92,73 +220,98 @@ class PortfolioProjectionService:
             portfolio_value: Current value in portfolio
             fund_name: Display name
             lookback_years: Years of historical data (3, 5, or 10)
+            closes: Prefetched monthly closes for the fund (skips the fetch)
+            spy_closes: Prefetched SPY closes (default: cached/fetched benchmark)
+            save: Write the cache file now (False lets a caller batch writes)
             
         Returns:
             FundRiskMetrics or None if data unavailable
         """
+        stats = self._fund_risk_stats(symbol, fund_name, lookback_years, closes, spy_closes, save)
+        if stats is None:
+            return None
+        return FundRiskMetrics(symbol=symbol, portfolio_value=portfolio_value, **stats)
+    
+    def _fund_risk_stats(
+        self,
+        symbol: str,
+        fund_name: str,
+        lookback_years: int,
+        closes: Optional[pd.Series],
+        spy_closes: Optional[pd.Series],
+        save: bool
+    ) -> Optional[Dict]:
+        """
+        Risk statistics for a single fund, from the cache or computed
+        
+        Same arguments as get_fund_risk_metrics (without portfolio_value).
+        
+        Returns:
+            Dict with name, beta, sharpe_ratio, std_dev_annual, annual_return
+            and alpha (the cache entry format), or None if data unavailable
+        """
         cache_key = f"risk_{symbol}_{lookback_years}y"
         
         # Check cache
         if cache_key in self.cache:
             cached = self.cache[cache_key]
-            metrics = FundRiskMetrics(
-                symbol=symbol,
-                name=fund_name or cached.get('name', symbol),
-                portfolio_value=portfolio_value,
-                beta=cached.get('beta', 0),
-                sharpe_ratio=cached.get('sharpe_ratio', 0),
-                std_dev_annual=cached.get('std_dev_annual', 0),
-                annual_return=cached.get('annual_return', 0),
-                alpha=cached.get('alpha', 0)
-            )
-            return metrics
+            return {
+                'name': fund_name or cached.get('name', symbol),
+                'beta': cached.get('beta', 0),
+                'sharpe_ratio': cached.get('sharpe_ratio', 0),
+                'std_dev_annual': cached.get('std_dev_annual', 0),
+                'annual_return': cached.get('annual_return', 0),
+                'alpha': cached.get('alpha', 0)
+            }
         
         try:
             logger.info(f"Fetching risk metrics for {symbol} ({lookback_years}-year lookback)...")
-            ticker = yf.Ticker(symbol)
             
             # Get historical data based on lookback period
             end_date = datetime.now()
             start_date = end_date - timedelta(days=lookback_years*365)
             
-            hist = ticker.history(start=start_date, end=end_date, interval="1mo")
+            if closes is None:
+                hist = yf.Ticker(symbol).history(start=start_date, end=end_date, interval="1mo")
+                closes = hist['Close'] if hist is not None and not hist.empty else None
             
-            if hist is None or hist.empty or len(hist) < 24:
+            if closes is None or len(closes) < MIN_HISTORY_MONTHS:
                 logger.warning(f"Insufficient historical data for {symbol}")
                 return None
             
             # Calculate monthly returns
-            hist['Return'] = hist['Close'].pct_change()
-            monthly_returns = hist['Return'].dropna()
+            monthly_returns = self._month_index(closes).pct_change().dropna()
             
             if len(monthly_returns) < 12:
                 logger.warning(f"Not enough return data for {symbol}")
                 return None
             
             # Get benchmark (S&P 500) for beta calculation
-            spy = yf.Ticker("SPY")
-            spy_hist = spy.history(start=start_date, end=end_date, interval="1mo")
-            spy_hist['Return'] = spy_hist['Close'].pct_change()
-            spy_returns = spy_hist['Return'].dropna()
+            if spy_closes is None:
+                spy_closes = self._get_spy_closes(start_date, end_date, lookback_years)
+                if spy_closes is None:
+                    return None
+            spy_returns = self._month_index(spy_closes).pct_change().dropna()
             
-            # Align dates
+            # Align dates, then do the statistics on plain float arrays - the
+            # series are ~120 points, where pandas per-op dispatch dominates
             common_dates = monthly_returns.index.intersection(spy_returns.index)
-            fund_returns = monthly_returns.loc[common_dates]
-            market_returns = spy_returns.loc[common_dates]
+            fund_returns = monthly_returns.loc[common_dates].to_numpy(dtype=np.float64)
+            market_returns = spy_returns.loc[common_dates].to_numpy(dtype=np.float64)
             
             # Calculate metrics
             # Annual return (geometric mean)
-            total_return = (1 + fund_returns).prod() - 1
+            total_return = np.prod(1 + fund_returns) - 1
             years = len(fund_returns) / 12
             annual_return = (1 + total_return) ** (1/years) - 1 if years > 0 else 0
             
-            # Standard deviation (annualized)
-            monthly_std = fund_returns.std()
+            # Standard deviation (annualized, sample std like pandas)
+            monthly_std = np.std(fund_returns, ddof=1)
             std_dev_annual = monthly_std * np.sqrt(12)
             
             # Beta
-            covariance = fund_returns.cov(market_returns)
-            market_variance = market_returns.var()
+            covariance = np.cov(fund_returns, market_returns, ddof=1)[0, 1]
+            market_variance = np.var(market_returns, ddof=1)
             beta = covariance / market_variance if market_variance > 0 else 1.0
             
             # Sharpe Ratio
@@ -166,17 +319,17 @@ class PortfolioProjectionService:
             sharpe_ratio = excess_return / std_dev_annual if std_dev_annual > 0 else 0
             
             # Alpha (Jensen's Alpha)
-            market_annual_return = (1 + market_returns).prod() ** (12/len(market_returns)) - 1
+            market_annual_return = np.prod(1 + market_returns) ** (12/len(market_returns)) - 1
             expected_return = RISK_FREE_RATE + beta * (market_annual_return - RISK_FREE_RATE)
             alpha = annual_return - expected_return
             
             # Get name from info if not provided
             if not fund_name:
-                info = ticker.info or {}
+                info = yf.Ticker(symbol).info or {}
                 fund_name = info.get('shortName', info.get('longName', symbol))
             
             # Cache the results
-            self.cache[cache_key] = {
+            stats = {
                 'name': fund_name,
                 'beta': round(beta, 3),
                 'sharpe_ratio': round(sharpe_ratio, 3),
@@ -184,20 +337,14 @@ class PortfolioProjectionService:
                 'annual_return': round(annual_return, 4),
                 'alpha': round(alpha, 4)
             }
-            self._save_cache()
+            self.cache[cache_key] = stats
+            self._dirty = True
+            if save:
+                self._save_cache()
             
             logger.info(f"  {symbol}: Beta={beta:.2f}, Sharpe={sharpe_ratio:.2f}, StdDev={std_dev_annual*100:.1f}%")
             
-            return FundRiskMetrics(
-                symbol=symbol,
-                name=fund_name,
-                portfolio_value=portfolio_value,
-                beta=round(beta, 3),
-                sharpe_ratio=round(sharpe_ratio, 3),
-                std_dev_annual=round(std_dev_annual, 4),
-                annual_return=round(annual_return, 4),
-                alpha=round(alpha, 4)
-            )
+            return dict(stats)
             
         except Exception as e:
             logger.error(f"Error calculating risk metrics for {symbol}: {e}")
@@ -219,9 +366,12 @@ class PortfolioProjectionService:
         # Filter to ETFs and Mutual Funds
         funds = [h for h in holdings if h.get('asset_type') in ['etf', 'mutual_fund']]
         
-        # Sort by value and take top 10
-        funds.sort(key=lambda x: float(x.get('total_value', 0)), reverse=True)
-        top_funds = funds[:10]
+        # Sort by value and take top 10 (values converted once; stable, so
+        # equal values keep holding order as list.sort did)
+        values = np.array([float(h.get('total_value', 0)) for h in funds], dtype=np.float64)
+        order = np.argsort(-values, kind='stable')[:10]
+        top_funds = [funds[i] for i in order]
+        top_values = values[order]
         
         if not top_funds:
             return {
@@ -233,38 +383,95 @@ class PortfolioProjectionService:
                 'lookback_years': lookback_years
             }
         
-        fund_metrics = []
-        total_value = 0
-        weighted_beta = 0
-        weighted_volatility = 0
-        weighted_return = 0
+        # One batched download for every uncached fund (plus SPY unless it is
+        # cached for today), instead of two history() round trips per fund
+        prefetched = {}
+        spy_closes = None
+        missing = [
+            h.get('symbol', '') for h in top_funds
+            if h.get('symbol') and f"risk_{h.get('symbol')}_{lookback_years}y" not in self.cache
+        ]
+        if missing:
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=lookback_years*365)
+            spy_closes = self._load_spy_closes(lookback_years, end_date)
+            symbols = missing if spy_closes is not None else missing + ['SPY']
+            prefetched = self._fetch_closes(list(dict.fromkeys(symbols)), start_date, end_date)
+            if spy_closes is None and len(prefetched.get('SPY', ())) >= MIN_HISTORY_MONTHS:
+                self._store_spy_closes(lookback_years, end_date, prefetched['SPY'])
+                spy_closes = self._load_spy_closes(lookback_years, end_date)
         
-        for holding in top_funds:
+        # Plain stats dicts rather than FundRiskMetrics objects, since they
+        # are flattened into the response dicts straight away
+        def fund_risk(holding: Dict) -> Optional[Dict]:
             symbol = holding.get('symbol', '')
-            value = float(holding.get('total_value', 0))
-            name = holding.get('name', symbol)
-            
-            metrics = self.get_fund_risk_metrics(symbol, value, name, lookback_years)
-            
-            if metrics:
+            # Funds missing from the batch fall back to the per-ticker fetch
+            # inside _fund_risk_stats
+            return self._fund_risk_stats(
+                symbol,
+                holding.get('name', symbol),
+                lookback_years,
+                prefetched.get(symbol),
+                spy_closes,
+                save=False
+            )
+        
+        # Per-ticker fallbacks are network-bound, so run them concurrently;
+        # cache hits and batched funds are cheap and stay sequential
+        n_fallback = len(set(missing) - set(prefetched))
+        if n_fallback > 1 and spy_closes is None:
+            # Fetch the shared benchmark once up front rather than racing
+            # for it in every worker
+            try:
+                spy_closes = self._get_spy_closes(start_date, end_date, lookback_years)
+            except Exception as e:
+                logger.warning(f"Could not fetch SPY benchmark: {e}")
+        if n_fallback > 1 and spy_closes is not None:
+            # Workers only add their own risk_ keys to self.cache; without a
+            # benchmark each fund would fetch and store SPY itself (pruning
+            # self.cache while other workers write to it), so stay serial
+            with ThreadPoolExecutor(max_workers=min(RISK_FETCH_WORKERS, n_fallback)) as pool:
+                results = list(pool.map(fund_risk, top_funds))
+        else:
+            results = [fund_risk(holding) for holding in top_funds]
+        
+        fund_metrics = []
+        analyzed = np.array([stats is not None for stats in results], dtype=bool)
+        betas = np.zeros(len(results))
+        volatilities = np.zeros(len(results))
+        returns = np.zeros(len(results))
+        
+        for i, (holding, stats) in enumerate(zip(top_funds, results)):
+            if stats:
+                value = float(top_values[i])
                 fund_metrics.append({
-                    'symbol': metrics.symbol,
-                    'name': metrics.name,
-                    'portfolio_value': metrics.portfolio_value,
-                    'beta': metrics.beta,
-                    'sharpe_ratio': metrics.sharpe_ratio,
-                    'std_dev_annual': metrics.std_dev_annual,
-                    'volatility_pct': metrics.std_dev_annual * 100,
-                    'annual_return': metrics.annual_return,
-                    'annual_return_pct': metrics.annual_return * 100,
-                    'alpha': metrics.alpha,
-                    'alpha_pct': metrics.alpha * 100
+                    'symbol': holding.get('symbol', ''),
+                    'name': stats['name'],
+                    'portfolio_value': value,
+                    'beta': stats['beta'],
+                    'sharpe_ratio': stats['sharpe_ratio'],
+                    'std_dev_annual': stats['std_dev_annual'],
+                    'volatility_pct': stats['std_dev_annual'] * 100,
+                    'annual_return': stats['annual_return'],
+                    'annual_return_pct': stats['annual_return'] * 100,
+                    'alpha': stats['alpha'],
+                    'alpha_pct': stats['alpha'] * 100
                 })
                 
-                total_value += value
-                weighted_beta += value * metrics.beta
-                weighted_volatility += value * metrics.std_dev_annual
-                weighted_return += value * metrics.annual_return
+                betas[i] = stats['beta']
+                volatilities[i] = stats['std_dev_annual']
+                returns[i] = stats['annual_return']
+        
+        # Value-weighted aggregates over the funds that had data
+        weights = top_values[analyzed]
+        total_value = float(weights.sum())
+        weighted_beta = float(np.dot(weights, betas[analyzed]))
+        weighted_volatility = float(np.dot(weights, volatilities[analyzed]))
+        weighted_return = float(np.dot(weights, returns[analyzed]))
+        
+        # One cache write for all funds fetched above
+        if self._dirty:
+            self._save_cache()
         
         # Calculate portfolio-level metrics
         if total_value > 0:
@@ -314,39 +521,102 @@ class PortfolioProjectionService:
         # Real return (after inflation)
         real_return = annual_return - INFLATION_RATE
         
-        projections = []
+        # All years at once: one element-wise op per scenario
+        year_arr = np.arange(1, years + 1)
         
-        for year in range(1, years + 1):
-            # Base case: compound at real return rate
-            base_case = current_value * ((1 + real_return) ** year)
-            
-            # Adjust for uncertainty that grows with time
-            # Use sqrt(year) scaling for standard deviation
-            year_std = volatility * np.sqrt(year)
-            
-            # Best case: +1 standard deviation
-            best_return = real_return + year_std / year  # Annualized adjustment
-            best_case = current_value * ((1 + best_return) ** year)
-            
-            # Worst case: -1 standard deviation
-            worst_return = real_return - year_std / year
-            worst_case = current_value * ((1 + worst_return) ** year)
-            
-            # Very worst case: -2 standard deviations
-            very_worst_return = real_return - 2 * year_std / year
-            very_worst_case = current_value * ((1 + very_worst_return) ** year)
-            
-            projections.append(ProjectionScenario(
+        # Base case: compound at real return rate
+        base_case = current_value * ((1 + real_return) ** year_arr)
+        
+        # Adjust for uncertainty that grows with time
+        # Use sqrt(year) scaling for standard deviation, annualized per year
+        annual_std = volatility * np.sqrt(year_arr) / year_arr
+        
+        # Best case: +1 standard deviation
+        best_case = current_value * ((1 + (real_return + annual_std)) ** year_arr)
+        
+        # Worst case: -1 standard deviation
+        worst_case = current_value * ((1 + (real_return - annual_std)) ** year_arr)
+        
+        # Very worst case: -2 standard deviations (can't go below 0)
+        very_worst_case = np.maximum(0, current_value * ((1 + (real_return - 2 * annual_std)) ** year_arr))
+        
+        projections = [
+            ProjectionScenario(
                 year=year,
-                base_case=round(base_case, 2),
-                best_case=round(best_case, 2),
-                worst_case=round(worst_case, 2),
-                very_worst_case=round(max(0, very_worst_case), 2)  # Can't go below 0
-            ))
+                base_case=round(base, 2),
+                best_case=round(best, 2),
+                worst_case=round(worst, 2),
+                very_worst_case=round(very_worst, 2)
+            )
+            for year, base, best, worst, very_worst in zip(
+                year_arr.tolist(), base_case.tolist(), best_case.tolist(),
+                worst_case.tolist(), very_worst_case.tolist()
+            )
+        ]
         
         return projections
     
-    def get_projection_summary(self, holdings: List[Dict], total_value: float, lookback_years: int = 5) -> Dict:
+    def project_portfolio_monte_carlo(
+        self,
+        current_value: float,
+        years: int = 10,
+        custom_return: float = None,
+        custom_volatility: float = None,
+        n_paths: int = MONTE_CARLO_PATHS,
+        seed: Optional[int] = None
+    ) -> List[ProjectionScenario]:
+        """
+        Project future portfolio value by simulating return paths
+        
+        Path-dependent alternative to project_portfolio_value: simulates
+        n_paths yearly log-normal paths at once as a (n_paths, years) array
+        and reads each scenario off the per-year percentiles.
+        
+        Args:
+            current_value: Current portfolio value
+            years: Number of years to project
+            custom_return: Override annual return rate
+            custom_volatility: Override volatility
+            n_paths: Number of simulated paths
+            seed: Random seed for reproducible projections
+            
+        Returns:
+            List of ProjectionScenario for each year
+        """
+        # Same defaults and real-return basis as project_portfolio_value
+        annual_return = custom_return if custom_return is not None else 0.10
+        volatility = custom_volatility if custom_volatility is not None else 0.15
+        real_return = annual_return - INFLATION_RATE
+        
+        # Geometric Brownian motion with yearly steps
+        rng = np.random.default_rng(seed)
+        drift = np.log1p(real_return) - 0.5 * volatility ** 2
+        log_growth = rng.normal(drift, volatility, size=(n_paths, years))
+        paths = current_value * np.exp(np.cumsum(log_growth, axis=1))
+        
+        best, base, worst, very_worst = np.percentile(paths, MONTE_CARLO_PERCENTILES, axis=0)
+        
+        return [
+            ProjectionScenario(
+                year=year,
+                base_case=round(b, 2),
+                best_case=round(bc, 2),
+                worst_case=round(wc, 2),
+                very_worst_case=round(vw, 2)
+            )
+            for year, b, bc, wc, vw in zip(
+                range(1, years + 1), base.tolist(), best.tolist(),
+                worst.tolist(), very_worst.tolist()
+            )
+        ]
+    
+    def get_projection_summary(
+        self,
+        holdings: List[Dict],
+        total_value: float,
+        lookback_years: int = 5,
+        method: str = 'analytic'
+    ) -> Dict:
         """
         Get complete projection analysis for dashboard
         
@@ -354,6 +624,7 @@ class PortfolioProjectionService:
             holdings: List of holdings
             total_value: Total portfolio value
             lookback_years: Years of historical data (3, 5, or 10)
+            method: 'analytic' (std dev fan) or 'monte_carlo' (simulated paths)
         
         Returns:
             Dict with projections and risk metrics
@@ -370,7 +641,8 @@ class PortfolioProjectionService:
             volatility = 0.15  # Default 15%
         
         # Generate projections
-        projections = self.project_portfolio_value(
+        project = self.project_portfolio_monte_carlo if method == 'monte_carlo' else self.project_portfolio_value
+        projections = project(
             total_value,
             years=10,
             custom_return=annual_return + INFLATION_RATE,  # Add back inflation for nominal
@@ -395,7 +667,8 @@ class PortfolioProjectionService:
                 'volatility': round(volatility * 100, 2),
                 'inflation_rate': INFLATION_RATE * 100,
                 'risk_free_rate': RISK_FREE_RATE * 100,
-                'lookback_years': lookback_years
+                'lookback_years': lookback_years,
+                'method': method
             },
             'cache_timestamp': self.cache.get('timestamp', 0)
         }
\ No newline at end of file
@@ -9,8 +9,11 @@ CHANGELOG:
 - Provides: Current symbol being processed, progress percentage, timing info
 """
 import logging
+import os
 import threading
-from datetime import datetime
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from typing import Dict, Optional
 import json
 from pathlib import Path
@@ -20,9 +23,26 @@ logger = logging.getLogger(__name__)
 # Status file for persistence across requests
 STATUS_FILE = Path('/app/data/resolution_status.json')
 
+# Most recent errors kept in the status
+MAX_ERRORS = 50
+
+# Minimum seconds between status file writes during a run
+FLUSH_INTERVAL = 0.5
+
+# Seconds between writes from the background flusher
+FLUSHER_PERIOD = 1.0
+
 # Thread-safe lock for status updates
 _status_lock = threading.Lock()
 
+# Set when the in-memory status has changes not yet written to STATUS_FILE
+_dirty = False
+_last_flush = time.monotonic()
+_flusher: Optional[threading.Thread] = None
+
+# Progress fields of the last update_progress call, to skip flushing repeats
+_last_progress: Optional[tuple] = None
+
 # In-memory status (faster than file reads)
 _current_status = {
     'is_running': False,
@@ -37,12 +57,28 @@ _current_status = {
     'underlying_symbols_processed': 0,
     'cached_hits': 0,
     'api_calls': 0,
-    'started_at': None,
-    'last_update': None,
-    'errors': []
+    'started_at_ns': None,  # time.time_ns(), formatted in get_resolution_status
+    'last_update_ns': None,
+    'completed_at_ns': None,
+    'errors': deque(maxlen=MAX_ERRORS)
 }
 
 
+def _format_ns(ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() timestamp as an ISO string"""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+def _parse_iso_ns(value: Optional[str]) -> Optional[int]:
+    """Convert an ISO timestamp (status files written before *_ns) to time_ns"""
+    try:
+        return int(datetime.fromisoformat(value).timestamp() * 1_000_000_000)
+    except (TypeError, ValueError):
+        return None
+
+
 def _load_status() -> Dict:
     """Load status from file if exists"""
     global _current_status
@@ -50,21 +86,74 @@ def _load_status() -> Dict:
         if STATUS_FILE.exists():
             with open(STATUS_FILE, 'r') as f:
                 _current_status = json.load(f)
+            _current_status['errors'] = deque(_current_status.get('errors', []), maxlen=MAX_ERRORS)
+            # Older files stored ISO strings; keep their times in the ns fields
+            for key in ('started_at', 'last_update', 'completed_at'):
+                legacy = _current_status.pop(key, None)
+                if _current_status.get(f'{key}_ns') is None:
+                    _current_status[f'{key}_ns'] = _parse_iso_ns(legacy)
     except Exception as e:
         logger.error(f"Error loading resolution status: {e}")
     return _current_status
 
 
+def _serializable_status() -> Dict:
+    """Copy of the status with the errors deque as a plain list"""
+    return {**_current_status, 'errors': list(_current_status['errors'])}
+
+
 def _save_status():
-    """Save status to file"""
+    """Mark status as changed; the write happens in _maybe_flush"""
+    global _dirty
+    _dirty = True
+
+
+def _maybe_flush(force: bool = False):
+    """
+    Write status to file if it changed and the flush interval has passed
+    
+    Must be called with _status_lock held. Writes go to a temp file that is
+    swapped in with os.replace so readers never see a half-written file.
+    
+    Args:
+        force: Write now regardless of the flush interval
+    """
+    global _dirty, _last_flush
+    if not _dirty:
+        return
+    now = time.monotonic()
+    if not force and now - _last_flush < FLUSH_INTERVAL:
+        return
     try:
         STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(STATUS_FILE, 'w') as f:
-            json.dump(_current_status, f, indent=2, default=str)
+        tmp_file = STATUS_FILE.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(_serializable_status(), f, indent=2, default=str)
+        os.replace(tmp_file, STATUS_FILE)
+        _dirty = False
+        _last_flush = now
     except Exception as e:
         logger.error(f"Error saving resolution status: {e}")
 
 
+def _flush_loop():
+    """Background flusher: persist pending updates while a resolution runs"""
+    while True:
+        time.sleep(FLUSHER_PERIOD)
+        with _status_lock:
+            _maybe_flush(force=True)
+            if not _current_status.get('is_running'):
+                return
+
+
+def _start_flusher():
+    """Start the background flusher unless one is already running"""
+    global _flusher
+    if _flusher is None or not _flusher.is_alive():
+        _flusher = threading.Thread(target=_flush_loop, name='resolution-status-flusher', daemon=True)
+        _flusher.start()
+
+
 def start_resolution(snapshot_id: int, total_symbols: int = 0, 
                      parent_total: int = 0, underlying_total: int = 0):
     """
@@ -76,8 +165,10 @@ def start_resolution(snapshot_id: int, total_symbols: int = 0,
         parent_total: Number of parent holdings
         underlying_total: Estimated underlying symbols
     """
-    global _current_status
+    global _current_status, _last_progress
+    now_ns = time.time_ns()
     with _status_lock:
+        _last_progress = None
         _current_status = {
             'is_running': True,
             'snapshot_id': snapshot_id,
@@ -91,11 +182,13 @@ def start_resolution(snapshot_id: int, total_symbols: int = 0,
             'underlying_symbols_processed': 0,
             'cached_hits': 0,
             'api_calls': 0,
-            'started_at': datetime.now().isoformat(),
-            'last_update': datetime.now().isoformat(),
-            'errors': []
+            'started_at_ns': now_ns,
+            'last_update_ns': now_ns,
+            'errors': deque(maxlen=MAX_ERRORS)
         }
         _save_status()
+        _maybe_flush(force=True)
+        _start_flusher()
         logger.info(f"Resolution started for snapshot {snapshot_id}: {parent_total} parent, ~{underlying_total} underlying")
 
 
@@ -117,10 +210,11 @@ def update_progress(step: str, symbol: Optional[str] = None, processed: Optional
         underlying_total: Total underlying symbols (may update as we discover more)
         cached: Whether this symbol was found in cache
     """
-    global _current_status
+    global _current_status, _last_progress
+    progress = (step, symbol, processed, total, parent_processed, underlying_processed, underlying_total)
     with _status_lock:
         _current_status['current_step'] = step
-        _current_status['last_update'] = datetime.now().isoformat()
+        _current_status['last_update_ns'] = time.time_ns()
         
         if symbol:
             _current_status['current_symbol'] = symbol
@@ -139,7 +233,13 @@ def update_progress(step: str, symbol: Optional[str] = None, processed: Optional
         else:
             _current_status['api_calls'] = _current_status.get('api_calls', 0) + 1
         
+        # A repeat of the previous update only moves the counters and
+        # timestamp; mark them dirty for the background flusher but skip
+        # the immediate write
         _save_status()
+        if progress != _last_progress:
+            _last_progress = progress
+            _maybe_flush()
         
         if symbol:
             logger.debug(f"Resolution progress: {step} - {symbol}")
@@ -155,14 +255,14 @@ def log_error(symbol: str, error: str):
     """
     global _current_status
     with _status_lock:
+        # Bounded deque drops the oldest error past MAX_ERRORS
         _current_status['errors'].append({
             'symbol': symbol,
             'error': error,
             'timestamp': datetime.now().isoformat()
         })
-        # Keep only last 50 errors
-        _current_status['errors'] = _current_status['errors'][-50:]
         _save_status()
+        _maybe_flush()
         logger.warning(f"Resolution error for {symbol}: {error}")
 
 
@@ -175,23 +275,21 @@ def complete_resolution(success: bool = True, message: Optional[str] = None):
         message: Optional completion message
     """
     global _current_status
+    now_ns = time.time_ns()
     with _status_lock:
         _current_status['is_running'] = False
         _current_status['current_step'] = 'complete' if success else 'failed'
         _current_status['current_symbol'] = None
-        _current_status['completed_at'] = datetime.now().isoformat()
-        _current_status['last_update'] = datetime.now().isoformat()
+        _current_status['completed_at_ns'] = now_ns
+        _current_status['last_update_ns'] = now_ns
         if message:
             _current_status['completion_message'] = message
         _save_status()
+        _maybe_flush(force=True)
         
         duration = "unknown"
-        if _current_status.get('started_at'):
-            try:
-                started = datetime.fromisoformat(_current_status['started_at'])
-                duration = str(datetime.now() - started)
-            except:
-                pass
+        if _current_status.get('started_at_ns'):
+            duration = str(timedelta(microseconds=(now_ns - _current_status['started_at_ns']) // 1000))
         
         status = "successfully" if success else "with errors"
         logger.info(f"Resolution completed {status} in {duration}. Processed {_current_status['symbols_processed']} symbols.")
@@ -226,17 +324,17 @@ def get_resolution_status() -> Dict:
         underlying_remaining = max(0, underlying_total - underlying_done)
         total_remaining = parent_remaining + underlying_remaining
         
-        # Calculate elapsed time
+        # Calculate elapsed time (whole seconds, no datetime parsing)
         elapsed = None
-        if _current_status.get('started_at') and _current_status.get('is_running'):
-            try:
-                started = datetime.fromisoformat(_current_status['started_at'])
-                elapsed = str(datetime.now() - started).split('.')[0]  # Remove microseconds
-            except:
-                pass
+        started_ns = _current_status.get('started_at_ns')
+        if started_ns and _current_status.get('is_running'):
+            elapsed = str(timedelta(seconds=(time.time_ns() - started_ns) // 1_000_000_000))
         
         return {
-            **_current_status,
+            **_serializable_status(),
+            'started_at': _format_ns(started_ns),
+            'last_update': _format_ns(_current_status.get('last_update_ns')),
+            'completed_at': _format_ns(_current_status.get('completed_at_ns')),
             'progress_percentage': round(progress_pct, 1),
             'elapsed_time': elapsed,
             'error_count': len(_current_status.get('errors', [])),
@@ -7,16 +7,44 @@ CHANGELOG:
 - Fixed: Percentages now sum to 100% (adds "Other" if needed)
 - Fixed: Cash holdings properly categorized
 """
+import copy
 import logging
+import threading
 from typing import Dict, List
-from collections import defaultdict
-from decimal import Decimal
+import numpy as np
+import pandas as pd
 from app.database import db_session
-from app.models import BrokerAccount, PortfolioSnapshot, Holding
-from sqlalchemy import func, desc
+from app.models import Holding
+from sqlalchemy import cast, Float
+from sqlalchemy.engine import Row
 
 logger = logging.getLogger(__name__)
 
+# Number of top positions returned for concentration analysis
+CONCENTRATION_TOP_N = 10
+
+# Recent results keyed by (generation, snapshot ids). Holding writers call
+# invalidate_risk_metrics_cache(), which bumps the generation so a result
+# computed from pre-write data can never be stored under a live key.
+METRICS_CACHE_SIZE = 4
+_metrics_cache: Dict[tuple, Dict] = {}
+_metrics_cache_lock = threading.Lock()
+_metrics_generation = 0
+
+
+def invalidate_risk_metrics_cache():
+    """
+    Drop cached risk metrics
+    
+    Call after committing any change to holdings (CSV upload, resolver
+    enrichment). Only clears this process's cache - the app runs a single
+    gunicorn worker, and out-of-process writers must restart it.
+    """
+    global _metrics_generation
+    with _metrics_cache_lock:
+        _metrics_generation += 1
+        _metrics_cache.clear()
+
 
 class RiskAggregator:
     """Aggregate risk metrics across portfolio"""
@@ -34,41 +62,68 @@ class RiskAggregator:
             }
         """
         with db_session() as session:
-            # Get latest snapshots
-            latest_snapshots = self._get_latest_snapshots(session)
+            # Get latest snapshots - ids are all we need, so skip loading
+            # snapshot and broker objects
+            snapshot_ids = self._get_latest_snapshot_ids(session)
             
-            if not latest_snapshots:
+            if not snapshot_ids:
                 return self._empty_metrics()
             
-            # Get all holdings
-            snapshot_ids = [s.id for s in latest_snapshots]
-            holdings = session.query(Holding).filter(
+            # Dashboard polls repeat this with unchanged holdings - reuse the result
+            with _metrics_cache_lock:
+                cache_key = (_metrics_generation, tuple(sorted(snapshot_ids)))
+                cached = _metrics_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Risk metrics served from cache")
+                return copy.deepcopy(cached)
+            
+            # Get all holdings - only the columns the breakdowns use, as plain
+            # rows rather than hydrated Holding objects
+            holdings = session.query(Holding).with_entities(
+                Holding.symbol,
+                Holding.name,
+                cast(Holding.total_value, Float).label('total_value'),
+                Holding.asset_type,
+                Holding.sector,
+                Holding.country,
+                Holding.underlying_holdings
+            ).filter(
                 Holding.portfolio_snapshot_id.in_(snapshot_ids)
             ).all()
             
             if not holdings:
                 return self._empty_metrics()
             
+            # total_value comes back as float (cast in the query, no Decimal
+            # objects); one array reused by every breakdown
+            values = np.fromiter((h.total_value for h in holdings),
+                                 dtype=np.float64, count=len(holdings))
+            cash_mask = np.fromiter((h.asset_type == 'cash' for h in holdings),
+                                    dtype=bool, count=len(holdings))
+            
             # Calculate total portfolio value
-            total_value = sum(float(h.total_value) for h in holdings)
+            total_value = float(values.sum())
             
             # Separate cash from investments
-            cash_value = sum(float(h.total_value) for h in holdings if h.asset_type == 'cash')
-            investment_holdings = [h for h in holdings if h.asset_type != 'cash']
+            cash_value = float(values[cash_mask].sum())
+            
+            # Expand holdings (and ETF/MF underlyings) into one frame shared by
+            # all three breakdowns instead of walking the holdings three times
+            exposures = self._build_exposure_frame(holdings, values)
             
             # Calculate concentration (top holdings) - excludes cash
-            concentration = self._calculate_concentration(investment_holdings, total_value)
+            concentration = self._calculate_concentration(exposures, total_value)
             
             # Calculate sector breakdown - excludes cash
-            sectors = self._calculate_sector_breakdown(investment_holdings, total_value)
+            sectors = self._calculate_sector_breakdown(exposures, total_value)
             
             # Calculate geography breakdown - includes cash as separate category
-            geography = self._calculate_geography_breakdown(holdings, total_value, cash_value)
+            geography = self._calculate_geography_breakdown(exposures, total_value, cash_value)
             
             # Determine overall risk
             overall_risk = self._calculate_overall_risk(concentration)
             
-            return {
+            metrics = {
                 'concentration': concentration,
                 'sectors': sectors,
                 'geography': geography,
@@ -76,13 +131,102 @@ class RiskAggregator:
                 'total_value': total_value,
                 'cash_value': cash_value
             }
+            
+            with _metrics_cache_lock:
+                # Skip storing if holdings were written while we computed
+                if cache_key[0] == _metrics_generation:
+                    _metrics_cache[cache_key] = copy.deepcopy(metrics)
+                while len(_metrics_cache) > METRICS_CACHE_SIZE:
+                    _metrics_cache.pop(next(iter(_metrics_cache)))
+            
+            return metrics
     
-    def _get_latest_snapshots(self, session) -> List[PortfolioSnapshot]:
-        """Get the most recent snapshot for each active broker - OPTIMIZED"""
-        from app.services.db_utils import get_latest_snapshots
-        return get_latest_snapshots(session)
+    def _get_latest_snapshot_ids(self, session) -> List[int]:
+        """Get the most recent snapshot id for each active broker - OPTIMIZED"""
+        from app.services.db_utils import get_latest_snapshot_ids
+        return get_latest_snapshot_ids(session)
+
+    def _build_exposure_frame(self, holdings: List[Row], values: np.ndarray) -> pd.DataFrame:
+        """
+        Flatten holdings into one row per exposure
+        
+        Direct stocks and cash contribute one row each. ETFs/MFs contribute one
+        row per underlying holding (tagged asset_type 'stock'), or a single row
+        for the fund itself when its underlying holdings are not resolved yet.
+        Other asset types (bonds, etc.) are not part of any breakdown.
+        
+        Args:
+            holdings: Holding rows (symbol, name, total_value, asset_type,
+                sector, country, underlying_holdings) from the latest snapshots
+            values: total_value of each holding as float64, in holdings order
+            
+        Returns:
+            pd.DataFrame: Columns symbol, name, value, sector, country, asset_type
+        """
+        symbols, names, row_values, sectors, countries, asset_types = [], [], [], [], [], []
+        
+        for holding, holding_value in zip(holdings, values.tolist()):
+            asset_type = holding.asset_type
+            
+            if asset_type == 'cash':
+                rows = [(holding.symbol, holding.name, holding_value, None, None, 'cash')]
+            
+            elif asset_type == 'stock':
+                rows = [(holding.symbol, holding.name or holding.symbol, holding_value,
+                         holding.sector or 'Unknown', holding.country or 'Unknown', 'stock')]
+            
+            elif asset_type in ('etf', 'mutual_fund'):
+                underlyings = Holding.parse_underlying_holdings(holding.underlying_holdings)
+                if underlyings:
+                    rows = [
+                        (u['symbol'], u.get('name', u['symbol']), float(u.get('value', 0)),
+                         u.get('sector', 'Unknown'), u.get('country', 'Unknown'), 'stock')
+                        for u in underlyings
+                    ]
+                else:
+                    rows = [(holding.symbol, holding.name, holding_value,
+                             holding.sector or 'Unknown', holding.country or 'Unknown', asset_type)]
+            
+            else:
+                continue
+            
+            for symbol, name, value, sector, country, row_type in rows:
+                symbols.append(symbol)
+                names.append(name)
+                row_values.append(value)
+                sectors.append(sector)
+                countries.append(country)
+                asset_types.append(row_type)
+        
+        return pd.DataFrame({
+            'symbol': pd.Series(symbols, dtype=object),
+            'name': pd.Series(names, dtype=object),
+            'value': pd.Series(row_values, dtype='float64'),
+            'sector': pd.Series(sectors, dtype=object),
+            'country': pd.Series(countries, dtype=object),
+            'asset_type': pd.Series(asset_types, dtype=object),
+        })
+
+    @staticmethod
+    def _sum_by(keys: pd.Series, values: pd.Series) -> pd.Series:
+        """
+        Sum values per distinct key, keys in first-seen order
+        
+        Keys are factorized to integer codes and summed with np.bincount, one
+        C-level pass without per-group overhead.
+        
+        Args:
+            keys: Group key per row (None/NaN is grouped as 'Unknown')
+            values: Value per row
+            
+        Returns:
+            pd.Series: Sum per key, indexed by key
+        """
+        codes, uniques = pd.factorize(keys.fillna('Unknown'))
+        sums = np.bincount(codes, weights=values.to_numpy(), minlength=len(uniques))
+        return pd.Series(sums, index=uniques)
 
-    def _calculate_concentration(self, holdings: List[Holding], total_value: float) -> List[Dict]:
+    def _calculate_concentration(self, exposures: pd.DataFrame, total_value: float) -> List[Dict]:
         """
         Calculate concentration - return TOP stocks by allocation
         
@@ -90,46 +234,34 @@ class RiskAggregator:
         Includes both direct holdings and underlying holdings from ETFs/MFs.
         Excludes cash holdings.
         """
-        symbol_totals = defaultdict(lambda: {
-            'symbol': '',
-            'name': '',
-            'value': 0,
-            'allocation_pct': 0,
-            'asset_type': 'stock'
-        })
+        stocks = exposures[exposures['asset_type'] == 'stock']
         
-        # Process all holdings (direct stocks + underlying)
-        for holding in holdings:
-            # Skip cash
-            if holding.asset_type == 'cash':
-                continue
-                
-            if holding.asset_type == 'stock':
-                symbol = holding.symbol
-                symbol_totals[symbol]['symbol'] = symbol
-                symbol_totals[symbol]['name'] = holding.name or symbol
-                symbol_totals[symbol]['value'] += float(holding.total_value)
-                symbol_totals[symbol]['asset_type'] = 'stock'
-            
-            elif holding.asset_type in ['etf', 'mutual_fund'] and holding.underlying_holdings_list:
-                for underlying in holding.underlying_holdings_list:
-                    symbol = underlying['symbol']
-                    underlying_value = float(underlying.get('value', 0))
-                    
-                    symbol_totals[symbol]['symbol'] = symbol
-                    symbol_totals[symbol]['name'] = underlying.get('name', symbol)
-                    symbol_totals[symbol]['value'] += underlying_value
-                    symbol_totals[symbol]['asset_type'] = 'stock'
+        # Sum per symbol in first-seen order
+        symbol_values = self._sum_by(stocks['symbol'], stocks['value'])
         
-        # Calculate allocation percentages
-        for data in symbol_totals.values():
-            data['allocation_pct'] = (data['value'] / total_value * 100) if total_value > 0 else 0
+        if total_value > 0:
+            allocation = symbol_values / total_value * 100
+        else:
+            allocation = symbol_values * 0
         
-        # Return TOP 10 stocks by allocation (client will filter by threshold)
-        all_stocks = list(symbol_totals.values())
-        all_stocks.sort(key=lambda x: x['allocation_pct'], reverse=True)
+        # Return TOP 10 stocks by allocation (client will filter by threshold).
+        # nlargest is a partial selection; ties keep first-seen order.
+        top = allocation.nlargest(CONCENTRATION_TOP_N, keep='first')
         
-        top_stocks = all_stocks[:10]
+        # Names only for the selected symbols; the name shown is the last one seen
+        top_rows = stocks[stocks['symbol'].isin(top.index)]
+        symbol_names = top_rows.drop_duplicates('symbol', keep='last').set_index('symbol')['name']
+        
+        top_stocks = [
+            {
+                'symbol': symbol,
+                'name': symbol_names[symbol],
+                'value': float(symbol_values[symbol]),
+                'allocation_pct': float(pct),
+                'asset_type': 'stock'
+            }
+            for symbol, pct in top.items()
+        ]
         
         logger.info(f"Returning top {len(top_stocks)} stocks for concentration analysis")
         if top_stocks:
@@ -137,39 +269,15 @@ class RiskAggregator:
         
         return top_stocks    
 
-    def _calculate_sector_breakdown(self, holdings: List[Holding], total_value: float) -> Dict[str, float]:
+    def _calculate_sector_breakdown(self, exposures: pd.DataFrame, total_value: float) -> Dict[str, float]:
         """
         Calculate sector allocation breakdown
         Includes both direct holdings AND underlying holdings from ETFs/MFs
         Excludes cash holdings
         Results are sorted by percentage descending
         """
-        from app.services.stock_info_service import StockInfoService
-        
-        service = StockInfoService()
-        sector_totals = defaultdict(float)
-        
-        for holding in holdings:
-            # Skip cash
-            if holding.asset_type == 'cash':
-                continue
-            
-            # Direct stock holdings - use their sector
-            if holding.asset_type == 'stock':
-                sector = holding.sector or 'Unknown'
-                sector_totals[sector] += float(holding.total_value)
-            
-            # ETF/MF with underlying - aggregate underlying sectors
-            elif holding.asset_type in ['etf', 'mutual_fund'] and holding.underlying_holdings_list:
-                for underlying in holding.underlying_holdings_list:
-                    sector = underlying.get('sector', 'Unknown')
-                    underlying_value = float(underlying.get('value', 0))
-                    sector_totals[sector] += underlying_value
-            
-            # ETF/MF without underlying - use parent sector
-            elif holding.asset_type in ['etf', 'mutual_fund']:
-                sector = holding.sector or 'Unknown'
-                sector_totals[sector] += float(holding.total_value)
+        invested = exposures[exposures['asset_type'] != 'cash']
+        sector_totals = self._sum_by(invested['sector'], invested['value'])
         
         # Convert to percentages
         sector_percentages = {}
@@ -192,7 +300,7 @@ class RiskAggregator:
         return sector_percentages
 
 
-    def _calculate_geography_breakdown(self, holdings: List[Holding], total_value: float, 
+    def _calculate_geography_breakdown(self, exposures: pd.DataFrame, total_value: float, 
                                        cash_value: float = 0) -> Dict[str, float]:
         """
         Calculate geographic allocation breakdown
@@ -200,36 +308,15 @@ class RiskAggregator:
         Includes Cash as a separate category
         Ensures total sums to 100%
         """
-        from app.services.stock_info_service import StockInfoService
-        
-        service = StockInfoService()
-        geo_totals = defaultdict(float)
+        from app.services.stock_info_service import map_country_to_geography
         
-        for holding in holdings:
-            # Cash goes to "Cash" category
-            if holding.asset_type == 'cash':
-                geo_totals['Cash'] += float(holding.total_value)
-                continue
-            
-            # Direct stock holdings - use their country
-            if holding.asset_type == 'stock':
-                country = holding.country or 'Unknown'
-                geography = service._map_country_to_geography(country)
-                geo_totals[geography] += float(holding.total_value)
-            
-            # ETF/MF with underlying - aggregate underlying geographies
-            elif holding.asset_type in ['etf', 'mutual_fund'] and holding.underlying_holdings_list:
-                for underlying in holding.underlying_holdings_list:
-                    country = underlying.get('country', 'Unknown')
-                    geography = service._map_country_to_geography(country)
-                    underlying_value = float(underlying.get('value', 0))
-                    geo_totals[geography] += underlying_value
-            
-            # ETF/MF without underlying - use parent country
-            elif holding.asset_type in ['etf', 'mutual_fund']:
-                country = holding.country or 'Unknown'
-                geography = service._map_country_to_geography(country)
-                geo_totals[geography] += float(holding.total_value)
+        # Cash goes to "Cash" category, everything else by its country's region.
+        # Only a few dozen distinct countries, so map each one once.
+        countries = exposures['country']
+        geo_map = {country: map_country_to_geography(country) for country in countries.unique()}
+        geography = countries.map(geo_map)
+        geography = geography.where(exposures['asset_type'] != 'cash', 'Cash')
+        geo_totals = self._sum_by(geography, exposures['value'])
         
         # Convert to percentages
         geo_percentages = {}
@@ -21,6 +21,7 @@ import logging
 import yfinance as yf
 import time
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime, timedelta
@@ -39,9 +40,9 @@ class StockInfoService:
     """Service to fetch stock information from Yahoo Finance via yfinance"""
     
     # Geography mappings - expanded for international support
-    US_COUNTRIES = {'United States', 'USA', 'US', 'United States of America'}
+    US_COUNTRIES = frozenset({'United States', 'USA', 'US', 'United States of America'})
     
-    DEVELOPED_INTERNATIONAL = {
+    DEVELOPED_INTERNATIONAL = frozenset({
         # Europe
         'United Kingdom', 'UK', 'Great Britain', 'GBR',
         'Germany', 'DEU', 'Federal Republic of Germany',
@@ -70,9 +71,9 @@ class StockInfoService:
         'Canada', 'CAN',
         # Israel
         'Israel', 'ISR',
-    }
+    })
     
-    EMERGING_MARKETS = {
+    EMERGING_MARKETS = frozenset({
         # Asia
         'China', 'CHN', "People's Republic of China",
         'India', 'IND',
@@ -101,7 +102,7 @@ class StockInfoService:
         'Qatar', 'QAT',
         'Egypt', 'EGY',
         'Kuwait', 'KWT',
-    }
+    })
     
     # International ticker suffix to country mapping
     # Used to infer country when yfinance doesn't return it
@@ -564,28 +565,7 @@ class StockInfoService:
         Returns:
             'US', 'International Developed', 'Emerging Markets', or 'Unknown'
         """
-        if not country or country == 'Unknown':
-            return 'Unknown'
-        
-        # Normalize for comparison
-        country_normalized = country.strip()
-        
-        # Check US
-        if country_normalized in self.US_COUNTRIES or 'United States' in country_normalized:
-            return 'US'
-        
-        # Check Developed International
-        if country_normalized in self.DEVELOPED_INTERNATIONAL:
-            return 'International Developed'
-        
-        # Check Emerging Markets
-        if country_normalized in self.EMERGING_MARKETS:
-            return 'Emerging Markets'
-        
-        # Default to International Developed for unknown countries
-        # (Most stocks in global indices are from developed markets)
-        logger.debug(f"Unknown country '{country}', defaulting to International Developed")
-        return 'International Developed'
+        return map_country_to_geography(country)
     
     def get_progress_stats(self) -> Dict:
         """
@@ -617,6 +597,48 @@ class StockInfoService:
         return list(self.cache.keys())
 
 
+# Region for every country named in the StockInfoService sets. Later entries
+# win, so the precedence matches the US -> Developed -> Emerging check order.
+COUNTRY_TO_GEOGRAPHY = {
+    **{country: 'Emerging Markets' for country in StockInfoService.EMERGING_MARKETS},
+    **{country: 'International Developed' for country in StockInfoService.DEVELOPED_INTERNATIONAL},
+    **{country: 'US' for country in StockInfoService.US_COUNTRIES},
+}
+
+
+@lru_cache(maxsize=512)
+def map_country_to_geography(country: str) -> str:
+    """
+    Map country to geographic region
+    
+    Memoized - a portfolio only has a few dozen distinct country strings.
+    
+    Args:
+        country: Country name
+        
+    Returns:
+        'US', 'International Developed', 'Emerging Markets', or 'Unknown'
+    """
+    if not country or country == 'Unknown':
+        return 'Unknown'
+    
+    # Normalize for comparison
+    country_normalized = country.strip()
+    
+    geography = COUNTRY_TO_GEOGRAPHY.get(country_normalized)
+    if geography is not None:
+        return geography
+    
+    # Variants like "United States (NY)"
+    if 'United States' in country_normalized:
+        return 'US'
+    
+    # Default to International Developed for unknown countries
+    # (Most stocks in global indices are from developed markets)
+    logger.debug(f"Unknown country '{country}', defaulting to International Developed")
+    return 'International Developed'
+
+
 # Global instance to maintain cache and rate limiting across calls
 _global_service = None
 